@@ -0,0 +1,102 @@
+"""
+Bloom Filter - Compact "seen" set for long crawls
+Spider-wide dedup at a few bits per key instead of a full string per key.
+
+A Bloom filter never forgets a key it has seen, but may report an unseen key
+as seen with probability ``error_rate`` (those items are skipped).
+RotatingBloomFilter bounds that rate for filters kept across crawls.
+"""
+
+import hashlib
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over str keys.
+
+    Usage:
+        seen = BloomFilter(capacity=1_000_000, error_rate=0.001)
+        if url in seen:
+            continue
+        seen.add(url)
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        """Derive k bit positions from one 128-bit digest (double hashing)"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def add(self, key: str) -> bool:
+        """Add key; returns True if it was (probably) not present before"""
+        bits = self._bits
+        added = False
+        for pos in self._positions(key):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class RotatingBloomFilter:
+    """
+    Two-generation Bloom filter for "seen" sets that outlive one crawl.
+
+    Keys go into the current generation; lookups check both. Once the current
+    generation holds `capacity` keys it becomes the previous one and the
+    oldest generation is dropped, so the false-positive rate stays below about
+    2 * error_rate instead of climbing as a single filter overfills. Keys
+    older than two generations may be reported as unseen again.
+
+    Usage:
+        seen = RotatingBloomFilter(capacity=100_000, error_rate=1e-6)
+        if tweet_id not in seen:
+            seen.add(tweet_id)
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.current = BloomFilter(capacity, error_rate)
+        self.previous = None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.current or (self.previous is not None and key in self.previous)
+
+    def add(self, key: str) -> bool:
+        """Add key to the current generation; returns True if it was (probably) not there"""
+        if len(self.current) >= self.capacity:
+            logger.info(
+                f"Seen filter reached its capacity of {self.capacity} keys: rotating "
+                f"(forgetting the {len(self.previous or ())} oldest)"
+            )
+            self.previous = self.current
+            self.current = BloomFilter(self.capacity, self.error_rate)
+        return self.current.add(key)
+
+    def __len__(self) -> int:
+        return len(self.current) + len(self.previous or ())
@@ -15,6 +15,8 @@ How it works:
 
 import re
 
+from job_finder.matcher import KeywordMatcher
+
 # ═══════════════════════════════════════════════════════════════════════════
 # PROFILE - Your identity (used for scoring)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -216,6 +218,26 @@ _tool_pattern = re.compile(
     r'\b(' + '|'.join(TOOL_KEYWORDS) + r')\b', re.IGNORECASE
 )
 
+# Social posts: every group is literal, so one multi-pattern scan answers all
+# of is_relevant_social's questions. Arabic keywords match anywhere (like
+# _relevant_ar_pattern); the rest on whole words.
+_social_matcher = KeywordMatcher({
+    'arabic': RELEVANT_KEYWORDS_AR,
+    # Role keywords that are relevant on their own...
+    'specific': [
+        'Designer', 'Artist', '3D', 'CGI', 'VFX', 'Blender', 'Unreal', 'Figma',
+        'Art Director', 'Creative Director', 'Motion Graphics', 'UI/UX', 'UIUX',
+        'DOOH', 'Anamorphic', 'Generative AI',
+    ],
+    # ...broad ones that also need a hiring indicator
+    'relevant': RELEVANT_KEYWORDS,
+    'hiring': [
+        'hiring', 'looking for', 'seeking', 'wanted', 'job', 'position',
+        'opening', 'role', 'apply', 'join', 'opportunity', 'remote', 'freelance',
+        'مطلوب', 'وظيفة', 'توظيف', 'نبحث',
+    ],
+}, substring_groups=('arabic',))
+
 
 def score_job(title='', description='', location='', job_type=''):
     """
@@ -295,28 +317,16 @@ def is_relevant_social(text):
     if not text or len(text) < 15:
         return False
 
-    # Arabic keywords always relevant (very specific to job context)
-    if _relevant_ar_pattern.search(text):
-        return True
+    found = _social_matcher.find_groups(text)
 
-    # Specific keywords that are always relevant (unlikely to be spam)
-    _specific = re.compile(
-        r'\b(Designer|Artist|3D|CGI|VFX|Blender|Unreal|Figma|'
-        r'Art Director|Creative Director|Motion Graphics|UI/?UX|'
-        r'DOOH|Anamorphic|Generative AI)\b', re.IGNORECASE
-    )
-    if _specific.search(text):
+    # Arabic keywords always relevant (very specific to job context)
+    # Specific keywords are always relevant too (unlikely to be spam)
+    if 'arabic' in found or 'specific' in found:
         return True
 
     # Broad keywords (Product, AI, Web, Digital, Creative, Animation)
     # need a hiring indicator to be relevant
-    if _relevant_pattern.search(text):
-        _hiring = re.compile(
-            r'\b(hiring|looking for|seeking|wanted|job|position|'
-            r'opening|role|apply|join|opportunity|remote|freelance|'
-            r'مطلوب|وظيفة|توظيف|نبحث)\b', re.IGNORECASE
-        )
-        if _hiring.search(text):
-            return True
+    if 'relevant' in found and 'hiring' in found:
+        return True
 
     return False
@@ -0,0 +1,64 @@
+"""
+Feed Exporters - orjson-backed JSON and JSON Lines output
+Same file layout as Scrapy's JSON exporters, with items encoded by orjson.
+
+orjson is optional (pip install orjson). Without it, or for output settings
+orjson cannot reproduce (non UTF-8 encoding, indent other than 2), the
+exporters behave exactly like the Scrapy classes they extend.
+"""
+
+from scrapy.exporters import JsonItemExporter, JsonLinesItemExporter
+
+try:
+    # Optional fast JSON encoder
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_option(exporter, lines=False):
+    """orjson option flags matching the exporter settings, or None if unsupported"""
+    if orjson is None:
+        return None
+    if (exporter.encoding or '').lower().replace('_', '-') not in ('utf-8', 'utf8'):
+        return None
+    # Datetimes go through ScrapyJSONEncoder.default to keep Scrapy's format
+    option = orjson.OPT_PASSTHROUGH_DATETIME
+    if lines:
+        # One object per line, never indented
+        return option | orjson.OPT_APPEND_NEWLINE
+    if exporter.indent is None or exporter.indent <= 0:
+        return option
+    if exporter.indent == 2:
+        return option | orjson.OPT_INDENT_2
+    return None
+
+
+class OrjsonItemExporter(JsonItemExporter):
+    """JSON array feed encoded with orjson"""
+
+    def __init__(self, file, **kwargs):
+        super().__init__(file, **kwargs)
+        self._orjson_option = _orjson_option(self)
+
+    def export_item(self, item):
+        if self._orjson_option is None:
+            return super().export_item(item)
+        itemdict = dict(self._get_serialized_fields(item))
+        data = orjson.dumps(itemdict, default=self.encoder.default, option=self._orjson_option)
+        self._add_comma_after_first()
+        self.file.write(data)
+
+
+class OrjsonLinesItemExporter(JsonLinesItemExporter):
+    """JSON Lines feed encoded with orjson"""
+
+    def __init__(self, file, **kwargs):
+        super().__init__(file, **kwargs)
+        self._orjson_option = _orjson_option(self, lines=True)
+
+    def export_item(self, item):
+        if self._orjson_option is None:
+            return super().export_item(item)
+        itemdict = dict(self._get_serialized_fields(item))
+        self.file.write(orjson.dumps(itemdict, default=self.encoder.default, option=self._orjson_option))
@@ -0,0 +1,20 @@
+"""
+HTTP Cache Policy - RFC 2616 caching that still skips error responses
+Scrapy's RFC2616Policy ignores HTTPCACHE_IGNORE_HTTP_CODES, so a 429/503 sent
+with max-age or Expires would be cached and replayed on the next run.
+"""
+
+from scrapy.extensions.httpcache import RFC2616Policy
+
+
+class RFC2616IgnoreCodesPolicy(RFC2616Policy):
+    """RFC2616Policy that never caches HTTPCACHE_IGNORE_HTTP_CODES (as DummyPolicy does)"""
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self.ignore_http_codes = set(map(int, settings.getlist('HTTPCACHE_IGNORE_HTTP_CODES')))
+
+    def should_cache_response(self, response, request):
+        if response.status in self.ignore_http_codes:
+            return False
+        return super().should_cache_response(response, request)
@@ -0,0 +1,123 @@
+"""
+Keyword Matcher - Multi-group whole-word literal scanning
+One pass over the text answers "which keyword groups occur?" for all groups.
+
+Uses a pyahocorasick automaton when the package is installed (single linear
+scan, no alternation backtracking) and falls back to one compiled regex per
+group otherwise. Both backends match case-insensitively on whole words: a hit
+may not touch a word character on either side (``(?<!\\w)...(?!\\w)``).
+Groups listed in ``substring_groups`` match anywhere instead (e.g. Arabic stems
+that take prefixes such as "ال").
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+try:
+    # Optional C Aho-Corasick automaton (pip install pyahocorasick)
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive whole-word matcher over named groups of literal keywords.
+
+    Usage:
+        matcher = KeywordMatcher({'keyword': RELEVANT_KEYWORDS, 'hiring': ['hiring', 'job']})
+        matcher.matches(title, 'keyword')                 # any keyword of one group
+        matcher.find_groups(text) >= {'keyword', 'hiring'}  # one scan, all groups
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]], substring_groups: Iterable[str] = ()):
+        self.groups = {name: tuple(keywords) for name, keywords in groups.items()}
+        self._all_groups = frozenset(self.groups)
+        self._substring_groups = frozenset(substring_groups)
+        self._automaton = None
+        self._patterns = {}
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for name, keywords in self.groups.items():
+                for keyword in keywords:
+                    key = keyword.lower()
+                    hits = automaton.get(key, (len(key), frozenset()))[1]
+                    automaton.add_word(key, (len(key), hits | {name}))
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            for name, keywords in self.groups.items():
+                # Longest first so shared prefixes resolve to the longest keyword
+                ordered = sorted(set(keywords), key=len, reverse=True)
+                alternation = '(?:' + '|'.join(map(re.escape, ordered)) + ')'
+                if name not in self._substring_groups:
+                    alternation = r'(?<!\w)' + alternation + r'(?!\w)'
+                self._patterns[name] = re.compile(alternation, re.IGNORECASE)
+
+    def find_groups(self, text: str, wanted: Optional[Iterable[str]] = None) -> FrozenSet[str]:
+        """Return the groups with a whole-word hit, stopping once all `wanted` are found"""
+        wanted = self._all_groups if wanted is None else frozenset(wanted)
+        if not text:
+            return frozenset()
+
+        if self._automaton is None:
+            return frozenset(name for name in wanted if self._patterns[name].search(text))
+
+        found = set()
+        substring_groups = self._substring_groups
+        lowered = text.lower()
+        size = len(lowered)
+        for end, (length, names) in self._automaton.iter(lowered):
+            names = names & (wanted - found)
+            if not names:
+                continue
+            start = end - length + 1
+            if ((start > 0 and _is_word_char(lowered[start - 1])) or
+                    (end + 1 < size and _is_word_char(lowered[end + 1]))):
+                # Not a whole word: only substring groups count
+                names = names & substring_groups
+                if not names:
+                    continue
+            found |= names
+            if found >= wanted:
+                break
+        return frozenset(found)
+
+    def matches(self, text: str, group: str) -> bool:
+        """True if any keyword of `group` occurs as a whole word"""
+        return bool(self.find_groups(text, (group,)))
+
+
+class TermTagger:
+    """
+    One regex pass that maps named whole-word terms to (kind, value) tags.
+
+    Each term is (name, pattern, tags). A term may set several tags, so one
+    word can feed several answers ("UAE" -> a remote region and a location).
+    Terms are tried in list order at each position, so list longer spellings
+    ("Saudi Arabia") before their prefixes ("Saudi").
+
+    Usage:
+        tagger = TermTagger([('uae', r'UAE|Dubai', [('location', 'UAE')]), ...])
+        if ('location', 'UAE') in tagger.tags(text): ...
+    """
+
+    def __init__(self, terms: Iterable[Tuple[str, str, Iterable[Tuple[str, Optional[str]]]]]):
+        terms = list(terms)
+        self._pattern = re.compile(
+            '|'.join(rf'(?P<{name}>\b(?:{pattern})\b)' for name, pattern, _ in terms),
+            re.IGNORECASE
+        )
+        self._tags = {name: tuple(tags) for name, _, tags in terms}
+
+    def tags(self, text: str) -> Set[Tuple[str, Optional[str]]]:
+        """All tags of the terms occurring in text"""
+        found: Set[Tuple[str, Optional[str]]] = set()
+        for match in self._pattern.finditer(text):
+            found.update(self._tags[match.lastgroup])
+        return found
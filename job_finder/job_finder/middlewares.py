@@ -3,14 +3,18 @@ Enhanced Middlewares:
 - User-Agent Rotation
 - Random Delays (Human-like behavior)
 - Proxy Support
-- Retry Logic with Exponential Backoff
+- Retry Logic with Exponential Backoff (Retry-After aware)
 - Captcha Detection
 """
 
 import random
-import time
 import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from twisted.internet.task import deferLater
 from scrapy.downloadermiddlewares.retry import RetryMiddleware
+from scrapy.utils.defer import maybe_deferred_to_future
 from scrapy.utils.response import response_status_message
 
 from .user_agents import get_full_headers
@@ -20,6 +24,12 @@ from .captcha_handler import captcha_handler
 logger = logging.getLogger(__name__)
 
 
+async def _async_sleep(delay):
+    """Wait without blocking the reactor: only the awaiting request is held back"""
+    from twisted.internet import reactor
+    await maybe_deferred_to_future(deferLater(reactor, delay, lambda: None))
+
+
 class RandomUserAgentMiddleware:
     """Rotates User-Agent on every request to avoid detection."""
 
@@ -48,12 +58,12 @@ class RandomDelayMiddleware:
         max_delay = settings.getfloat('RANDOM_DELAY_MAX', 3.0)
         return cls(delay_range=(min_delay, max_delay))
 
-    def process_request(self, request, spider):
+    async def process_request(self, request, spider):
         if request.meta.get('dont_delay'):
             return None
         delay = random.uniform(self.min_delay, self.max_delay)
         spider.logger.debug(f"Adding random delay: {delay:.2f}s")
-        time.sleep(delay)
+        await _async_sleep(delay)
         return None
 
 
@@ -99,8 +109,13 @@ class ExponentialBackoffRetryMiddleware(RetryMiddleware):
         self.base_delay = settings.getfloat('RETRY_BASE_DELAY', 1.0)
         self.max_delay = settings.getfloat('RETRY_MAX_DELAY', 60.0)
         self.jitter = settings.getfloat('RETRY_JITTER', 0.5)
+        # Start pacing a host when its X-Rate-Limit-Remaining drops below this
+        self.rate_limit_low_remaining = settings.getint('RATE_LIMIT_LOW_REMAINING', 5)
         additional_codes = settings.getlist('RETRY_EXTRA_HTTP_CODES', [403, 429, 500, 502, 503, 504])
         self.retry_http_codes = set(self.retry_http_codes) | set(additional_codes)
+        # Download slot key -> monotonic time until which its delay is ours
+        # (AutoThrottle is told not to adjust it)
+        self._held_slots = {}
 
     def _get_retry_delay(self, retry_count):
         """Calculate exponential backoff delay with jitter"""
@@ -110,15 +125,66 @@ class ExponentialBackoffRetryMiddleware(RetryMiddleware):
         delay += random.uniform(-jitter_range, jitter_range)
         return max(0.1, delay)
 
-    def _retry(self, request, reason, spider):
+    def _get_retry_after(self, response):
+        """Seconds requested by a Retry-After header (delta-seconds or HTTP-date)"""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        value = value.decode('latin-1').strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def _get_rate_limit_reset(self, response):
+        """Seconds until an X-Rate-Limit-Reset epoch (Twitter API style), if sent"""
+        value = response.headers.get('X-Rate-Limit-Reset')
+        if not value or not value.strip().isdigit():
+            return None
+        return max(0.0, int(value) - datetime.now(timezone.utc).timestamp())
+
+    def _hold_slot_delay(self, request, delay, duration, backoff=1.0):
+        """
+        Raise the host's download slot delay to `delay`, so its queued requests
+        wait too, and keep AutoThrottle from changing it for the next `duration`
+        seconds. The delay is never lowered; with `backoff` it becomes at least
+        that multiple of the current one.
+        """
+        downloader = self.crawler.engine.downloader
+        key = downloader.get_slot_key(request)
+        slot = downloader.slots.get(key)
+        if slot is None:
+            return
+        slot.delay = min(max(slot.delay * backoff, delay), self.max_delay)
+        if duration > 0:
+            self._held_slots[key] = time.monotonic() + duration
+
+    def process_request(self, request, spider):
+        if not self._held_slots:
+            return None
+        key = self.crawler.engine.downloader.get_slot_key(request)
+        held_until = self._held_slots.get(key)
+        if held_until is not None:
+            if time.monotonic() < held_until:
+                request.meta['autothrottle_dont_adjust_delay'] = True
+            else:
+                del self._held_slots[key]
+        return None
+
+    async def _retry(self, request, reason, spider, min_delay=0.0):
         retry_count = request.meta.get('retry_count', 0)
         if retry_count < self.max_retry_times:
-            delay = self._get_retry_delay(retry_count)
+            delay = max(self._get_retry_delay(retry_count), min(min_delay, self.max_delay))
             spider.logger.warning(
                 f"Retrying {request.url} (attempt {retry_count + 1}/{self.max_retry_times}) "
                 f"after {delay:.2f}s - Reason: {reason}"
             )
-            time.sleep(delay)
+            await _async_sleep(delay)
             retry_request = request.copy()
             retry_request.meta['retry_count'] = retry_count + 1
             retry_request.dont_filter = True
@@ -130,14 +196,27 @@ class ExponentialBackoffRetryMiddleware(RetryMiddleware):
             spider.logger.error(f"Max retries reached for {request.url}")
             return None
 
-    def process_response(self, request, response, spider):
+    async def process_response(self, request, response, spider):
         if response.status in self.retry_http_codes:
             reason = response_status_message(response.status)
-            return self._retry(request, reason, spider) or response
+            min_delay = 0.0
+            if response.status in (429, 503):
+                # Throttled: honour Retry-After and back the whole host off
+                # until the server's wait is over
+                min_delay = (self._get_retry_after(response) or
+                             self._get_rate_limit_reset(response) or 0.0)
+                self._hold_slot_delay(request, min_delay, min_delay, backoff=1.5)
+            return await self._retry(request, reason, spider, min_delay) or response
+        remaining = response.headers.get('X-Rate-Limit-Remaining', b'').strip()
+        if remaining.isdigit() and int(remaining) < self.rate_limit_low_remaining:
+            # Quota nearly used up: pace what is left over the rest of the
+            # window (all of it when nothing is left), held until it resets
+            reset = self._get_rate_limit_reset(response) or 0.0
+            self._hold_slot_delay(request, reset / (int(remaining) + 1), reset)
         return response
 
-    def process_exception(self, request, exception, spider):
-        return self._retry(request, str(exception), spider)
+    async def process_exception(self, request, exception, spider):
+        return await self._retry(request, str(exception), spider)
 
 
 class CaptchaDetectionMiddleware:
@@ -44,6 +44,10 @@ RETRY_BASE_DELAY = 2.0
 RETRY_MAX_DELAY = 60.0
 RETRY_JITTER = 0.3
 
+# Pace a host once its X-Rate-Limit-Remaining header (Twitter API v2 search:
+# 450 requests / 15 min) drops below this many requests
+RATE_LIMIT_LOW_REMAINING = 5
+
 # =============================================================================
 # PROXY SETTINGS
 # =============================================================================
@@ -59,6 +63,14 @@ RETRY_JITTER = 0.3
 # CAPTCHA_SERVICE = '2captcha'
 # CAPTCHA_API_KEY = 'YOUR_API_KEY_HERE'
 
+# =============================================================================
+# SEARCH API SETTINGS
+# =============================================================================
+
+# Optional SerpAPI key for structured DuckDuckGo results (remote_jobs spider).
+# Also read from the SERPAPI_API_KEY environment variable or -a serpapi_key=...
+# SERPAPI_API_KEY = 'YOUR_API_KEY_HERE'
+
 # =============================================================================
 # COOKIE & HEADER SETTINGS
 # =============================================================================
@@ -142,6 +154,15 @@ LOG_FORMAT = '%(asctime)s [%(name)s] %(levelname)s: %(message)s'
 
 FEED_EXPORT_ENCODING = "utf-8"
 
+# JSON / JSON Lines feeds encoded with orjson when installed (same output
+# format, falls back to Scrapy's exporters otherwise)
+FEED_EXPORTERS = {
+    "json": "job_finder.exporters.OrjsonItemExporter",
+    "jsonlines": "job_finder.exporters.OrjsonLinesItemExporter",
+    "jsonl": "job_finder.exporters.OrjsonLinesItemExporter",
+    "jl": "job_finder.exporters.OrjsonLinesItemExporter",
+}
+
 # =============================================================================
 # TELNET (disabled for security)
 # =============================================================================
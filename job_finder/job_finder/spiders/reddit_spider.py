@@ -21,6 +21,10 @@ from job_finder.cv_config import RELEVANT_KEYWORDS, is_relevant
 
 logger = logging.getLogger(__name__)
 
+# Reddit answers rate-limited/soft-banned requests with a 200 and a tiny
+# JSON error body; anything shorter than this cannot be a real listing.
+MIN_LISTING_BODY = 256
+
 
 class RedditJobsSpider(scrapy.Spider):
     """
@@ -137,8 +141,18 @@ class RedditJobsSpider(scrapy.Spider):
         """Handle request failures gracefully"""
         logger.warning(f"Reddit request failed: {failure.request.url} - {failure.value}")
 
+    def _is_soft_fail(self, response):
+        """Check for error/short responses that can't contain any posts"""
+        if response.status != 200 or len(response.body) < MIN_LISTING_BODY:
+            logger.warning(f"Skipping short/error response from {response.url}")
+            return True
+        return False
+
     def parse_subreddit(self, response):
         """Parse subreddit JSON listing"""
+        if self._is_soft_fail(response):
+            return
+
         subreddit = response.meta.get('subreddit', 'unknown')
         flair_filter = response.meta.get('flair_filter')
 
@@ -195,6 +209,9 @@ class RedditJobsSpider(scrapy.Spider):
 
     def parse_search_results(self, response):
         """Parse Reddit search results JSON"""
+        if self._is_soft_fail(response):
+            return
+
         query = response.meta.get('query', 'unknown')
 
         try:
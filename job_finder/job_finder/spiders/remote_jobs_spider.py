@@ -14,10 +14,24 @@ Features:
 import scrapy
 import re
 import json
-from urllib.parse import urlencode, quote_plus
-from typing import List, Dict
+import os
+from collections import deque
+from functools import lru_cache
+from dataclasses import dataclass
+from urllib.parse import urlencode, urlparse, quote_plus
+from typing import Any, Dict, Iterator, Optional
 import logging
+from scrapy.http import Response
 from job_finder.cv_config import RELEVANT_KEYWORDS, is_relevant
+from job_finder.bloom import BloomFilter
+from job_finder.matcher import KeywordMatcher
+from job_finder.xpaths import compile_css, first
+
+try:
+    # Optional fast JSON decoder; orjson.JSONDecodeError subclasses json's
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +43,63 @@ _SKIP_URL_PARTS = [
     '/privacy', '/terms', '/cookie', '/legal', '/sitemap',
 ]
 
+# Pre-compiled patterns (built once at import, shared by every callback).
+# Only used as yes/no filters, so the groups are non-capturing.
+REMOTE_RE = re.compile(r'\b(?:remote|hybrid|work\s*from\s*home|wfh|distributed)\b', re.IGNORECASE)
+_COMPANY_SUFFIX_RE = re.compile(r'\s*(careers?|jobs?|hiring|opportunities).*$', re.IGNORECASE)
+CAREER_INDICATOR_RE = re.compile(r'career|job|hiring|work-with-us|join|opportunities', re.IGNORECASE)
+
+
+# Generic job card selectors for job boards, and the broader link fallback
+_BOARD_CARD_CSS = (
+    '.job-listing, .job-card, .job-item, article.job, li.job, '
+    'div[class*="job-row"], tr[class*="job"]'
+)
+_BOARD_LINK_CSS = 'a[href*="job"], a[href*="position"]'
+
+# Per-card field extractors for job boards, evaluated on the raw lxml node
+_CARD_TITLE_XPATH = compile_css('h2::text, h3::text, .job-title::text, .title::text')
+_CARD_LINK_TEXT_XPATH = compile_css('a::text')
+_CARD_LINK_CHILD_TEXT_XPATH = compile_css('a *::text')
+_CARD_HREF_XPATH = compile_css('a::attr(href)')
+_CARD_COMPANY_XPATH = compile_css('.company::text, .company-name::text')
+_CARD_LOCATION_XPATH = compile_css('.location::text, .job-location::text')
+
+
+@dataclass(slots=True, frozen=True)
+class _Company:
+    """One company career page (curated or discovered), passed as request meta"""
+    url: str
+    name: str
+    region: str
+    country: str
+    type: str
+
+
+# Region/country recorded for career pages found through search discovery
+_DISCOVERED_REGION = 'Remote/International'
+
+
+def _flatten_companies(companies_by_region):
+    """Flatten {region: [company dict, ...]} into a tuple of _Company"""
+    return tuple(
+        _Company(
+            url=company['url'],
+            name=company['name'],
+            region=region,
+            country=company.get('country', region),
+            type=company.get('type', 'Unknown'),
+        )
+        for region, companies in companies_by_region.items()
+        for company in companies
+    )
+
+
+@lru_cache(maxsize=None)
+def _keyword_matcher(keywords):
+    """Matcher for one keyword tuple, built once per distinct list"""
+    return KeywordMatcher({'keyword': keywords})
+
 
 class RemoteJobsSpider(scrapy.Spider):
     """
@@ -281,6 +352,11 @@ class RemoteJobsSpider(scrapy.Spider):
         ]
     }
     
+    # Flat, immutable view of the table above, built once at class load
+    _COMPANIES = _flatten_companies(known_remote_companies)
+    # Hosts already crawled directly; search hits on them are redundant
+    _KNOWN_HOSTS = frozenset(urlparse(company.url).netloc for company in _COMPANIES)
+
     # Job boards for remote work
     remote_job_boards = [
         {
@@ -310,73 +386,121 @@ class RemoteJobsSpider(scrapy.Spider):
         },
     ]
     
+    # Link selector strategies for career pages (sites vary widely),
+    # joined into a single union query so each page is traversed once
+    career_link_selectors = [
+        # Common job listing structures
+        'a[href*="job"]',
+        'a[href*="position"]',
+        'a[href*="opening"]',
+        'a[href*="career"]',
+        '.job-listing a',
+        '.job-card a',
+        '.position-item a',
+        '.career-item a',
+        'li.job a',
+        'div[class*="job"] a',
+        'article[class*="job"] a',
+
+        # Modern frameworks
+        '[data-job-id] a',
+        '[data-position] a',
+        '.jobs-list a',
+        '.openings a',
+    ]
+    _CAREER_SELECTOR = ', '.join(career_link_selectors)
+
     custom_settings = {
-        'DOWNLOAD_DELAY': 3,
-        'CONCURRENT_REQUESTS': 4,
+        # No static floor: AutoThrottle derives per-host delays from latency
+        # (the project-wide DOWNLOAD_DELAY would otherwise act as a minimum)
+        'DOWNLOAD_DELAY': 0,
+        # ~30 distinct hosts: let them download in parallel while each host
+        # (Scrapy's default download slot) still gets one request at a time
+        'CONCURRENT_REQUESTS': 32,
         'CONCURRENT_REQUESTS_PER_DOMAIN': 1,
         'AUTOTHROTTLE_ENABLED': True,
-        'AUTOTHROTTLE_START_DELAY': 2,
+        'AUTOTHROTTLE_START_DELAY': 1,
         'AUTOTHROTTLE_MAX_DELAY': 10,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 1.0,
+
+        # Dozens of independent career sites: respect their robots.txt (the
+        # HTTP cache below also persists each robots.txt across runs). Search
+        # requests opt out in start_requests: DuckDuckGo disallows /html/
+        'ROBOTSTXT_OBEY': True,
+
+        # Persistent cache: repeat runs revalidate unchanged career pages
+        # (ETag/Last-Modified) instead of refetching and reparsing them
+        'HTTPCACHE_ENABLED': True,
+        'HTTPCACHE_EXPIRATION_SECS': 86400,  # 1 day
+        'HTTPCACHE_IGNORE_HTTP_CODES': [403, 429, 500, 502, 503, 504],
+        'HTTPCACHE_STORAGE': 'scrapy.extensions.httpcache.FilesystemCacheStorage',
+        'HTTPCACHE_POLICY': 'job_finder.httpcache.RFC2616IgnoreCodesPolicy',
     }
     
+    def __init__(self, serpapi_key=None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serpapi_key_arg = serpapi_key
+        # From relevant_keywords as set on the class, a subclass or -a
+        # (comma-separated there)
+        keywords = self.relevant_keywords
+        if isinstance(keywords, str):
+            keywords = keywords.split(',')
+        self._keyword_matcher = _keyword_matcher(tuple(keywords))
+        # Spider-wide link dedup (catches jobs linked from several pages)
+        self.seen_links = BloomFilter(capacity=1_000_000, error_rate=0.001)
+
     def start_requests(self):
         """Generate initial requests from multiple sources"""
+        # Optional SerpAPI key: structured DuckDuckGo results, no HTML parsing
+        self.serpapi_key = (
+            self._serpapi_key_arg
+            or self.settings.get('SERPAPI_API_KEY')
+            or os.environ.get('SERPAPI_API_KEY')
+        )
 
         # 1. Search engine queries (using DuckDuckGo - more scrape-friendly)
         for query in self.search_queries[:10]:
-            duckduckgo_url = f"https://html.duckduckgo.com/html/?q={quote_plus(query)}"
-            yield scrapy.Request(
-                duckduckgo_url,
-                callback=self.parse_search_results,
-                meta={
-                    'query': query,
-                    'source': 'DuckDuckGo'
-                },
-                errback=self.handle_error
-            )
-
-        # 2. Known company career pages - Saudi Arabia
-        for company in self.known_remote_companies.get("Saudi Arabia", []):
-            yield scrapy.Request(
-                company['url'],
-                callback=self.parse_career_page,
-                meta={
-                    'company_name': company['name'],
-                    'region': 'Saudi Arabia',
-                    'country': 'Saudi Arabia',
-                    'company_type': company.get('type', 'Unknown')
-                },
-                errback=self.handle_error
-            )
-
-        # 3. Known company career pages - UAE
-        for company in self.known_remote_companies.get("UAE", []):
+            meta = {
+                'query': query,
+                'source': 'DuckDuckGo',
+                # Robots rules are for the career sites this discovers; the
+                # engine's own disallow of /html/ would silently drop every query
+                'dont_obey_robotstxt': True,
+            }
+            if self.serpapi_key:
+                search_url = 'https://serpapi.com/search.json?' + urlencode({
+                    'engine': 'duckduckgo',
+                    'q': query,
+                    'kl': 'us-en',
+                    'api_key': self.serpapi_key,
+                })
+                callback = self.parse_search_results_json
+                # The URL carries the API key: keep it out of the on-disk HTTP cache
+                meta['dont_cache'] = True
+            else:
+                search_url = f"https://html.duckduckgo.com/html/?q={quote_plus(query)}"
+                callback = self.parse_search_results
             yield scrapy.Request(
-                company['url'],
-                callback=self.parse_career_page,
-                meta={
-                    'company_name': company['name'],
-                    'region': 'UAE',
-                    'company_type': company.get('type', 'Unknown')
-                },
+                search_url,
+                callback=callback,
+                meta=meta,
+                # Discovery first, so found career pages join the crawl early
+                priority=10,
                 errback=self.handle_error
             )
 
-        # 4. Known company career pages - Europe
-        for company in self.known_remote_companies.get("Europe", []):
-            yield scrapy.Request(
-                company['url'],
+        # 2. Known company career pages (Saudi Arabia, UAE, Europe)
+        yield from (
+            scrapy.Request(
+                company.url,
                 callback=self.parse_career_page,
-                meta={
-                    'company_name': company['name'],
-                    'region': 'Europe',
-                    'country': company.get('country', 'Europe'),
-                    'company_type': company.get('type', 'Unknown')
-                },
+                meta={'company': company},
                 errback=self.handle_error
             )
+            for company in self._COMPANIES
+        )
 
-        # 5. Remote job boards
+        # 3. Remote job boards
         for board in self.remote_job_boards:
             yield scrapy.Request(
                 board['url'],
@@ -388,6 +512,10 @@ class RemoteJobsSpider(scrapy.Spider):
                 errback=self.handle_error
             )
     
+    def has_keyword(self, text):
+        """Single linear pass for any CV keyword (whole words, case-insensitive)"""
+        return self._keyword_matcher.matches(text, 'keyword')
+
     def handle_error(self, failure):
         """Handle request failures gracefully"""
         logger.error(f"Request failed: {failure.request.url}")
@@ -407,25 +535,50 @@ class RemoteJobsSpider(scrapy.Spider):
             if not link:
                 continue
             
-            # Filter for career-related pages
-            career_indicators = ['career', 'job', 'hiring', 'work-with-us', 'join', 'opportunities']
-            if any(ind in link.lower() for ind in career_indicators):
-                yield scrapy.Request(
-                    link,
-                    callback=self.parse_career_page,
-                    meta={
-                        'company_name': self._extract_company_name(title, link),
-                        'region': 'Remote/International',
-                        'source': 'Search Discovery'
-                    },
-                    errback=self.handle_error
-                )
+            yield from self._discovery_request(link, title)
+
+    def parse_search_results_json(self, response):
+        """Parse SerpAPI DuckDuckGo JSON results to find career pages"""
+        query = response.meta.get('query')
+        logger.info(f"Parsing SerpAPI results for: {query}")
+
+        try:
+            data = json_loads(response.body)
+        except json.JSONDecodeError:
+            logger.error(f"Failed to parse SerpAPI results for: {query}")
+            return
+
+        for result in data.get('organic_results', [])[:10]:  # Limit results per query
+            link = result.get('link')
+            if link:
+                yield from self._discovery_request(link, result.get('title'))
+
+    def _discovery_request(self, link: str, title: Optional[str]) -> Iterator[scrapy.Request]:
+        """Request a search hit as a career page if its URL looks career-related"""
+        # Skip companies whose career page is already requested directly
+        if urlparse(link).netloc in self._KNOWN_HOSTS:
+            return
+
+        # Filter for career-related pages
+        if CAREER_INDICATOR_RE.search(link):
+            yield scrapy.Request(
+                link,
+                callback=self.parse_career_page,
+                meta={'company': _Company(
+                    url=link,
+                    name=self._extract_company_name(title, link),
+                    region=_DISCOVERED_REGION,
+                    country=_DISCOVERED_REGION,
+                    type='Search Discovery',
+                )},
+                errback=self.handle_error
+            )
     
-    def _extract_company_name(self, title: str, url: str) -> str:
+    def _extract_company_name(self, title: Optional[str], url: str) -> str:
         """Try to extract company name from title or URL"""
         if title:
             # Remove common suffixes
-            name = re.sub(r'\s*(careers?|jobs?|hiring|opportunities).*$', '', title, flags=re.I)
+            name = _COMPANY_SUFFIX_RE.sub('', title)
             if name.strip():
                 return name.strip()[:50]
         
@@ -434,168 +587,139 @@ class RemoteJobsSpider(scrapy.Spider):
         name = domain.replace('www.', '').split('.')[0]
         return name.title()
     
-    def parse_career_page(self, response):
+    def parse_career_page(self, response: Response) -> Iterator[Dict]:
         """Parse a company career page for job listings"""
-        company_name = response.meta.get('company_name', 'Unknown')
-        region = response.meta.get('region', 'Unknown')
-        country = response.meta.get('country', region)
+        company = response.meta['company']
+        company_name, region, country = company.name, company.region, company.country
         
         logger.info(f"Parsing career page: {company_name} ({response.url})")
         
-        # Create CV keyword pattern
-        pattern = re.compile(r'\b(' + '|'.join(self.relevant_keywords) + r')\b', re.IGNORECASE)
-        remote_pattern = re.compile(r'\b(remote|hybrid|work\s*from\s*home|wfh|distributed)\b', re.IGNORECASE)
-        
-        seen_links = set()
-        
-        # Try multiple selector strategies (sites vary widely)
-        selectors = [
-            # Common job listing structures
-            'a[href*="job"]',
-            'a[href*="position"]',
-            'a[href*="opening"]',
-            'a[href*="career"]',
-            '.job-listing a',
-            '.job-card a',
-            '.position-item a',
-            '.career-item a',
-            'li.job a',
-            'div[class*="job"] a',
-            'article[class*="job"] a',
-            
-            # Modern frameworks
-            '[data-job-id] a',
-            '[data-position] a',
-            '.jobs-list a',
-            '.openings a',
-        ]
-        
-        for selector in selectors:
-            links = response.css(selector)
-            
-            for link in links:
-                href = link.css('::attr(href)').get()
-                title = link.css('::text').get()
-                
-                if not href or not title:
-                    # Try getting text from child elements
-                    title = ' '.join(link.css('*::text').getall()).strip()
-                
-                if not title or not href:
-                    continue
+        # One union selector walks the tree once instead of once per strategy
+        for link in response.css(self._CAREER_SELECTOR):
+            # Read straight from the lxml node, skipping Selector wrapping
+            href = link.root.get('href')
+            # First descendant text node, as link.css('::text').get() gave
+            title = next(link.root.itertext(), None)
+
+            if not href or not title:
+                # Try getting text from child elements
+                title = ' '.join(link.root.itertext()).strip()
+
+            if not title or not href:
+                continue
 
-                title = title.strip()
+            title = title.strip()
 
-                # Skip very short titles (nav links, generic text)
-                if len(title) < 5:
-                    continue
+            # Skip very short titles (nav links, generic text)
+            if len(title) < 5:
+                continue
 
-                # Make link absolute
-                if href.startswith('/'):
-                    href = response.urljoin(href)
-                elif not href.startswith('http'):
-                    continue
+            # Make link absolute
+            if href.startswith('/'):
+                href = response.urljoin(href)
+            elif not href.startswith('http'):
+                continue
 
-                # Skip non-job URLs (blog, news, press, about pages)
-                href_lower = href.lower()
-                if any(part in href_lower for part in _SKIP_URL_PARTS):
-                    continue
+            # Skip non-job URLs (blog, news, press, about pages)
+            href_lower = href.lower()
+            if any(part in href_lower for part in _SKIP_URL_PARTS):
+                continue
 
-                # Dedup
-                if href in seen_links:
-                    continue
-                seen_links.add(href)
+            # Check relevance to CV
+            if not self.has_keyword(title):
+                continue
 
-                # Check relevance to CV
-                if not pattern.search(title):
-                    continue
-                
-                # Check if remote
-                is_remote = remote_pattern.search(title) or 'remote' in href.lower()
-                job_type = 'Remote' if is_remote else 'Hybrid/On-site'
-                
-                yield {
-                    'keyword_searched': 'Remote Job Search',
-                    'title': title,
-                    'company': company_name,
-                    'location': f"{country} ({job_type})",
-                    'region': region,
-                    'type': job_type,
-                    'link': href,
-                    'source': f'Career Page - {company_name}'
-                }
+            # Dedup only links that will be yielded: a URL first seen under an
+            # icon/"Apply" anchor must stay open for a later, matching title
+            if href in self.seen_links:
+                continue
+            self.seen_links.add(href)
+
+            # Check if remote
+            is_remote = REMOTE_RE.search(title) or 'remote' in href_lower
+            job_type = 'Remote' if is_remote else 'Hybrid/On-site'
+            
+            yield {
+                'keyword_searched': 'Remote Job Search',
+                'title': title,
+                'company': company_name,
+                'location': f"{country} ({job_type})",
+                'region': region,
+                'type': job_type,
+                'link': href,
+                'source': f'Career Page - {company_name}'
+            }
         
         # Also check for structured job data (JSON-LD)
         for script in response.css('script[type="application/ld+json"]::text').getall():
+            # Organization/WebSite/Breadcrumb blocks can't hold postings;
+            # skip decoding them entirely
+            if 'JobPosting' not in script:
+                continue
             try:
-                data = json.loads(script)
-                jobs = self._extract_jobs_from_jsonld(data, company_name, region)
-                for job in jobs:
-                    if pattern.search(job.get('title', '')):
-                        yield job
+                data = json_loads(script)
             except json.JSONDecodeError:
                 continue
+            for job in self._extract_jobs_from_jsonld(data, company_name, region):
+                if self.has_keyword(job.get('title', '')):
+                    yield job
     
-    def _extract_jobs_from_jsonld(self, data, company_name, region) -> List[Dict]:
-        """Extract jobs from JSON-LD structured data"""
-        jobs = []
-        
-        if isinstance(data, list):
-            for item in data:
-                jobs.extend(self._extract_jobs_from_jsonld(item, company_name, region))
-        elif isinstance(data, dict):
-            if data.get('@type') == 'JobPosting':
-                title = data.get('title', '')
-                url = data.get('url', '')
-                location = data.get('jobLocation', {})
-                
-                if isinstance(location, dict):
-                    location_str = location.get('address', {}).get('addressLocality', region)
+    def _extract_jobs_from_jsonld(self, data: Any, company_name: str, region: str) -> Iterator[Dict]:
+        """Lazily yield jobs from JSON-LD structured data (iterative walk, no recursion)"""
+        stack = deque([data])
+
+        while stack:
+            node = stack.popleft()
+            if isinstance(node, list):
+                stack.extend(node)
+            elif isinstance(node, dict):
+                if node.get('@type') == 'JobPosting':
+                    yield self._jobposting_to_item(node, company_name, region)
                 else:
-                    location_str = region
-                
-                jobs.append({
-                    'keyword_searched': 'Remote Job Search',
-                    'title': title,
-                    'company': company_name,
-                    'location': location_str,
-                    'region': region,
-                    'type': 'Full Time',
-                    'link': url,
-                    'source': f'Career Page (Structured) - {company_name}'
-                })
-        
-        return jobs
+                    # Descend into containers such as @graph / itemListElement
+                    stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+
+    def _jobposting_to_item(self, data: Dict, company_name: str, region: str) -> Dict:
+        """Build a job item from a single JSON-LD JobPosting"""
+        location = data.get('jobLocation', {})
+
+        if isinstance(location, dict):
+            location_str = location.get('address', {}).get('addressLocality', region)
+        else:
+            location_str = region
+
+        return {
+            'keyword_searched': 'Remote Job Search',
+            'title': data.get('title', ''),
+            'company': company_name,
+            'location': location_str,
+            'region': region,
+            'type': 'Full Time',
+            'link': data.get('url', ''),
+            'source': f'Career Page (Structured) - {company_name}'
+        }
     
-    def parse_remote_job_board(self, response):
+    def parse_remote_job_board(self, response: Response) -> Iterator[Dict]:
         """Parse remote work job boards"""
         board_name = response.meta.get('board_name', 'Unknown')
         
         logger.info(f"Parsing remote job board: {board_name}")
         
-        pattern = re.compile(r'\b(' + '|'.join(self.relevant_keywords) + r')\b', re.IGNORECASE)
-        
         # Generic job card selectors for job boards
-        job_cards = response.css('''
-            .job-listing,
-            .job-card,
-            .job-item,
-            article.job,
-            li.job,
-            div[class*="job-row"],
-            tr[class*="job"]
-        ''')
+        job_cards = response.css(_BOARD_CARD_CSS)
         
         if not job_cards:
             # Try broader selectors
-            job_cards = response.css('a[href*="job"], a[href*="position"]')
+            job_cards = response.css(_BOARD_LINK_CSS)
         
         for card in job_cards:
+            node = card.root
+
             # Try multiple title selectors
             title = (
-                card.css('h2::text, h3::text, .job-title::text, .title::text').get() or
-                card.css('a::text').get() or
-                ' '.join(card.css('a *::text').getall())
+                first(_CARD_TITLE_XPATH(node)) or
+                first(_CARD_LINK_TEXT_XPATH(node)) or
+                ' '.join(_CARD_LINK_CHILD_TEXT_XPATH(node))
             )
             
             if not title:
@@ -606,10 +730,10 @@ class RemoteJobsSpider(scrapy.Spider):
             if len(title) < 5:
                 continue
 
-            if not pattern.search(title):
+            if not self.has_keyword(title):
                 continue
 
-            href = card.css('a::attr(href)').get()
+            href = first(_CARD_HREF_XPATH(node))
             if href:
                 if not href.startswith('http'):
                     href = response.urljoin(href)
@@ -618,8 +742,8 @@ class RemoteJobsSpider(scrapy.Spider):
                 if any(part in href.lower() for part in _SKIP_URL_PARTS):
                     continue
                 
-                company = card.css('.company::text, .company-name::text').get() or 'Via ' + board_name
-                location = card.css('.location::text, .job-location::text').get() or 'Remote'
+                company = first(_CARD_COMPANY_XPATH(node)) or 'Via ' + board_name
+                location = first(_CARD_LOCATION_XPATH(node)) or 'Remote'
                 
                 yield {
                     'keyword_searched': 'Remote Job Board',
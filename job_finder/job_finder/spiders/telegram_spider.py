@@ -16,10 +16,136 @@ import re
 import json
 from urllib.parse import urlencode, quote_plus
 import logging
+from functools import lru_cache
 from job_finder.cv_config import RELEVANT_KEYWORDS, is_relevant_social
+from job_finder.bloom import BloomFilter
+from job_finder.matcher import KeywordMatcher, TermTagger
+from job_finder.xpaths import compile_css, first
 
 logger = logging.getLogger(__name__)
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Pre-compiled patterns (built once at import, used for every message)
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Single-word hiring indicators, scanned together with the CV keywords
+_HIRING_WORDS = [
+    'hiring', 'مطلوب', 'seeking', 'need', 'wanted', 'job', 'position',
+    'opportunity', 'فرصة', 'وظيفة', 'opening', 'role', 'freelance',
+    'apply', 'vacancy',
+]
+# Multi-word hiring phrases (flexible whitespace), only checked as a fallback
+_HIRING_PHRASE_RE = re.compile(
+    r'\b(looking\s*for|we\'?re?\s*hiring|join\s*(?:us|our)\s*team|'
+    r'remote\s*(?:position|role|job))\b',
+    re.IGNORECASE
+)
+
+@lru_cache(maxsize=None)
+def _screen_matcher(keywords):
+    """Matcher answering both "CV keyword?" and "hiring word?" in one scan"""
+    return KeywordMatcher({'keyword': keywords, 'hiring': _HIRING_WORDS})
+
+_MESSAGE_ID_RE = re.compile(r'/\d+$')
+_URL_RE = re.compile(r'https?://\S+')
+
+
+def _strip_urls(text):
+    """Remove URLs; most posts have none in the title line, so skip the sub"""
+    return _URL_RE.sub('', text) if 'http' in text else text
+
+
+_TITLE_PATTERNS = [
+    re.compile(p, re.I) for p in [
+        r'(?:hiring|looking\s*for)\s*(?:a\s+)?([^.!?\n]{10,80})',
+        r'(?:position|role|job):\s*([^.!?\n]{10,80})',
+        r'مطلوب\s+([^\n.!؟]{5,60})',
+        r'وظيفة\s*:?\s*([^\n.!؟]{5,60})',
+        r'فرصة\s*:?\s*([^\n.!؟]{5,60})',
+    ]
+]
+
+# Location / job-type terms, scanned in one pass. Each named term sets one or
+# more (kind, value) tags; the precedence lists below then pick the result.
+_TAG_TERMS = [
+    ('remote', r'remote|عن\s*بعد', [('remote', None), ('type', 'Remote')]),
+    ('remote_any', r'من\s*المنزل|anywhere|worldwide', [('remote', None)]),
+    ('uae', r'UAE|Dubai|دبي|الامارات', [('remote_region', 'Remote - UAE'), ('location', 'UAE')]),
+    ('abu_dhabi', r'Abu\s*Dhabi', [('location', 'UAE')]),
+    ('europe', r'Europe|EU', [('remote_region', 'Remote - Europe')]),
+    ('uk', r'UK', [('remote_region', 'Remote - Europe'), ('location', 'UK')]),
+    ('germany', r'Germany', [('remote_region', 'Remote - Europe'), ('location', 'Germany')]),
+    ('egypt', r'Egypt|مصر|القاهرة', [('remote_region', 'Remote - Egypt'), ('location', 'Egypt')]),
+    ('egypt_city', r'Cairo|Alexandria|اسكندرية', [('location', 'Egypt')]),
+    ('saudi', r'Riyadh|Saudi|السعودية', [('location', 'Saudi Arabia')]),
+    ('london', r'London', [('location', 'UK')]),
+    ('berlin', r'Berlin', [('location', 'Germany')]),
+    ('freelance', r'freelance|فريلانس|contract|project[-\s]based', [('type', 'Freelance')]),
+    ('part_time', r'part[-\s]?time|دوام\s*جزئي', [('type', 'Part Time')]),
+    ('full_time', r'full[-\s]?time|دوام\s*كامل', [('type', 'Full Time')]),
+]
+_TAGGER = TermTagger(_TAG_TERMS)
+
+_REMOTE_REGION_ORDER = ['Remote - UAE', 'Remote - Europe', 'Remote - Egypt']
+_LOCATION_ORDER = ['UAE', 'Egypt', 'Saudi Arabia', 'UK', 'Germany']
+_JOB_TYPE_ORDER = ['Freelance', 'Part Time', 'Remote', 'Full Time']
+
+_COMPANY_PATTERNS = [
+    re.compile(p, re.I) for p in [
+        r'(?:at|@|in|company:?)\s+([A-Z][A-Za-z0-9\s&.]{2,40}?)(?:\s+is|\s+-|\s+\(|,|\n)',
+        r'(?:شركة|في)\s+([^\n,]{3,40}?)(?:\s+تطلب|\s+محتاجة|\s+-)',
+    ]
+]
+
+# ATS / job-board hints in a post's outbound links (plain substrings)
+_JOB_LINK_RE = re.compile(
+    '|'.join(map(re.escape, [
+        'greenhouse', 'lever', 'workday', 'ashbyhq', 'bamboohr', 'jobs',
+        'careers', 'apply', 'hire', 'linkedin.com/jobs', 'wuzzuf', 'indeed',
+        'bayt',
+    ])),
+    re.IGNORECASE
+)
+
+# Message nodes of a channel page, and the per-message field extractors
+# evaluated on each raw lxml node
+_MESSAGE_XPATH = compile_css('.tgme_widget_message')
+_MESSAGE_WRAP_XPATH = compile_css('.tgme_widget_message_wrap')
+_MESSAGE_FALLBACK_XPATH = compile_css('[class*="message"]')
+_MSG_DATE_HREF_XPATH = compile_css('.tgme_widget_message_date::attr(href)')
+_MSG_TME_HREF_XPATH = compile_css('a[href*="t.me"]::attr(href)')
+_MSG_TEXT_XPATH = compile_css('.tgme_widget_message_text::text, .tgme_widget_message_text *::text')
+_MSG_DATETIME_XPATH = compile_css('.tgme_widget_message_date time::attr(datetime)')
+_MSG_VIEWS_XPATH = compile_css('.tgme_widget_message_views::text')
+_MSG_TEXT_HREF_XPATH = compile_css('.tgme_widget_message_text a::attr(href)')
+
+# Match: t.me/channelname or t.me/s/channelname or t.me/channelname/123
+_CHANNEL_HANDLE_RE = re.compile(r't\.me/(?:s/)?([a-zA-Z][\w]{2,30})')
+# Common non-channel paths
+_CHANNEL_SKIP_WORDS = frozenset(['share', 'addstickers', 'joinchat', 'proxy', 'socks'])
+_CLEAN_CHANNEL_RE = re.compile(r'\s*[-–|]\s*Telegram.*$', re.I)
+
+
+@lru_cache(maxsize=4096)
+def _channel_handle(url):
+    """Channel handle of a t.me URL (cached: the same links recur across searches)"""
+    match = _CHANNEL_HANDLE_RE.search(url)
+    if match:
+        handle = match.group(1)
+        # Skip common non-channel paths
+        if handle.lower() not in _CHANNEL_SKIP_WORDS:
+            return handle
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _channel_name(title):
+    """Channel name from a search result title (cached like _channel_handle)"""
+    if title:
+        name = _CLEAN_CHANNEL_RE.sub('', title).strip()
+        return name[:60] if name else 'Telegram Channel'
+    return 'Telegram Channel'
+
 
 class TelegramJobsSpider(scrapy.Spider):
     """
@@ -158,8 +284,15 @@ class TelegramJobsSpider(scrapy.Spider):
 
     custom_settings = {
         'DOWNLOAD_DELAY': 3,
-        'CONCURRENT_REQUESTS': 3,
+        # t.me and DuckDuckGo are independent hosts: overlap them, one request
+        # per host at a time, and pick the next request from an idle host
+        'CONCURRENT_REQUESTS': 16,
         'CONCURRENT_REQUESTS_PER_DOMAIN': 1,
+        'SCHEDULER_PRIORITY_QUEUE': 'scrapy.pqueues.DownloaderAwarePriorityQueue',
+        # t.me previews tolerate two in flight; DuckDuckGo keeps the default of one
+        'DOWNLOAD_SLOTS': {
+            't.me': {'concurrency': 2},
+        },
         'AUTOTHROTTLE_ENABLED': True,
         'AUTOTHROTTLE_START_DELAY': 2,
         'AUTOTHROTTLE_MAX_DELAY': 15,
@@ -167,26 +300,36 @@ class TelegramJobsSpider(scrapy.Spider):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.seen_messages = set()
-        self.discovered_channels = set()
+        # From relevant_keywords as set on the class, a subclass or -a
+        # (comma-separated there)
+        keywords = self.relevant_keywords
+        if isinstance(keywords, str):
+            keywords = keywords.split(',')
+        self._screen_matcher = _screen_matcher(tuple(keywords))
+        # Message links across all channels/pages; channels stay a plain set (few)
+        self.seen_messages = BloomFilter(capacity=100_000, error_rate=0.001)
+        # Seeded with the curated handles so discovery never re-fetches them
+        # (handles are case-insensitive on Telegram)
+        self.discovered_channels = {c['handle'].lower() for c in self.job_channels}
 
     def start_requests(self):
         """Generate requests for known channels and discovery search"""
 
         # 1. Scrape known job channels via public preview
+        # (ahead of discovered channels and "load more" pages in the t.me queue)
         for channel in self.job_channels:
             # t.me/s/ is the public web preview (no login needed)
             url = f"https://t.me/s/{channel['handle']}"
             yield scrapy.Request(
                 url,
                 callback=self.parse_channel,
+                priority=10,
                 meta={
                     'channel_handle': channel['handle'],
                     'channel_name': channel['name'],
                     'region': channel['region'],
                 },
                 errback=self.handle_error,
-                dont_filter=True,
             )
 
         # 2. Discover new channels via DuckDuckGo
@@ -212,64 +355,56 @@ class TelegramJobsSpider(scrapy.Spider):
 
         logger.info(f"Parsing Telegram channel: {channel_name} (@{channel_handle})")
 
-        pattern = re.compile(
-            r'\b(' + '|'.join(self.relevant_keywords) + r')\b',
-            re.IGNORECASE
-        )
-
-        hiring_pattern = re.compile(
-            r'\b(hiring|مطلوب|looking\s*for|seeking|need|wanted|job|position|'
-            r'opportunity|فرصة|وظيفة|opening|role|freelance|'
-            r'we\'?re?\s*hiring|join\s*(?:us|our)\s*team|apply|'
-            r'vacancy|remote\s*(?:position|role|job))\b',
-            re.IGNORECASE
-        )
-
-        # Telegram public preview uses .tgme_widget_message for each message
-        messages = response.css('.tgme_widget_message_wrap, .tgme_widget_message')
+        # Telegram public preview uses .tgme_widget_message for each message,
+        # nested in a .tgme_widget_message_wrap: take one node per post
+        root = response.selector.root
+        messages = _MESSAGE_XPATH(root) or _MESSAGE_WRAP_XPATH(root)
 
         if not messages:
             # Try alternative selectors
-            messages = response.css('[class*="message"]')
+            messages = _MESSAGE_FALLBACK_XPATH(root)
 
         logger.info(f"Found {len(messages)} messages in @{channel_handle}")
 
-        for msg in messages:
+        for node in messages:
+            # Get message link first: a hash lookup is cheaper than any text scan
+            msg_link = first(_MSG_DATE_HREF_XPATH(node))
+            if not msg_link:
+                msg_link = first(_MSG_TME_HREF_XPATH(node))
+            if not msg_link:
+                msg_link = f"https://t.me/s/{channel_handle}"
+
+            # Dedup (only accepted posts are recorded, see below)
+            if msg_link in self.seen_messages:
+                continue
+
             # Get message text
-            text_parts = msg.css('.tgme_widget_message_text::text, .tgme_widget_message_text *::text').getall()
+            text_parts = _MSG_TEXT_XPATH(node)
             text = ' '.join(text_parts).strip()
 
             if not text or len(text) < 20:
                 continue
 
+            found = self._screen_matcher.find_groups(text)
+
             # Must match CV keywords
-            if not pattern.search(text):
+            if 'keyword' not in found:
                 continue
 
             # Must look like a job post
-            if not hiring_pattern.search(text):
+            if 'hiring' not in found and not _HIRING_PHRASE_RE.search(text):
                 continue
 
-            # Get message link
-            msg_link = msg.css('.tgme_widget_message_date::attr(href)').get()
-            if not msg_link:
-                msg_link = msg.css('a[href*="t.me"]::attr(href)').get()
-            if not msg_link:
-                msg_link = f"https://t.me/s/{channel_handle}"
+            self.seen_messages.add(msg_link)
 
             # Get message date
-            date = msg.css('.tgme_widget_message_date time::attr(datetime)').get('')
+            date = first(_MSG_DATETIME_XPATH(node)) or ''
 
             # Get views count
-            views = msg.css('.tgme_widget_message_views::text').get('0')
-
-            # Dedup
-            if msg_link in self.seen_messages:
-                continue
-            self.seen_messages.add(msg_link)
+            views = first(_MSG_VIEWS_XPATH(node)) or '0'
 
             # Extract external links from message
-            links = msg.css('.tgme_widget_message_text a::attr(href)').getall()
+            links = _MSG_TEXT_HREF_XPATH(node)
             external_links = [l for l in links if 't.me' not in l and l.startswith('http')]
             apply_link = self._find_apply_link(external_links)
 
@@ -303,11 +438,6 @@ class TelegramJobsSpider(scrapy.Spider):
         results = response.css('a.result__a')
         logger.info(f"Discovery search found {len(results)} results for: {query}")
 
-        pattern = re.compile(
-            r'\b(' + '|'.join(self.relevant_keywords) + r')\b',
-            re.IGNORECASE
-        )
-
         for result in results[:15]:
             href = result.css('::attr(href)').get('')
             title = ' '.join(result.css('::text').getall()).strip()
@@ -317,21 +447,22 @@ class TelegramJobsSpider(scrapy.Spider):
 
             # Extract channel handle from URL
             channel_handle = self._extract_channel_handle(href)
-            if not channel_handle or channel_handle in self.discovered_channels:
+            if not channel_handle or channel_handle.lower() in self.discovered_channels:
                 continue
 
-            self.discovered_channels.add(channel_handle)
+            self.discovered_channels.add(channel_handle.lower())
+            channel_name = self._clean_channel_name(title)
 
             # Check if it's a specific message or a channel
-            if re.search(r'/\d+$', href):
+            if _MESSAGE_ID_RE.search(href):
                 # It's a specific message - still check if relevant
-                if pattern.search(title):
+                if self._screen_matcher.matches(title, 'keyword'):
                     yield self._build_item(
                         text=title,
                         link=href,
                         telegram_link=href,
                         channel_handle=channel_handle,
-                        channel_name=self._clean_channel_name(title),
+                        channel_name=channel_name,
                         region='Unknown',
                         date='',
                         views='0',
@@ -344,7 +475,7 @@ class TelegramJobsSpider(scrapy.Spider):
                         callback=self.parse_channel,
                         meta={
                             'channel_handle': channel_handle,
-                            'channel_name': self._clean_channel_name(title),
+                            'channel_name': channel_name,
                             'region': 'Discovered',
                         },
                         errback=self.handle_error,
@@ -357,7 +488,7 @@ class TelegramJobsSpider(scrapy.Spider):
                     callback=self.parse_channel,
                     meta={
                         'channel_handle': channel_handle,
-                        'channel_name': self._clean_channel_name(title),
+                        'channel_name': channel_name,
                         'region': 'Discovered',
                     },
                     errback=self.handle_error,
@@ -368,8 +499,9 @@ class TelegramJobsSpider(scrapy.Spider):
         """Build a standardized job item from Telegram message"""
 
         title = self._extract_title(text)
-        location = self._extract_location(text, region)
-        job_type = self._extract_job_type(text)
+        tags = self._scan_tags(text)
+        location = self._extract_location(tags, region)
+        job_type = self._extract_job_type(tags)
         company = self._extract_company(text)
 
         return {
@@ -390,19 +522,10 @@ class TelegramJobsSpider(scrapy.Spider):
 
     def _extract_title(self, text):
         """Extract job title from message text"""
-        patterns = [
-            r'(?:hiring|looking\s*for)\s*(?:a\s+)?([^.!?\n]{10,80})',
-            r'(?:position|role|job):\s*([^.!?\n]{10,80})',
-            r'مطلوب\s+([^\n.!؟]{5,60})',
-            r'وظيفة\s*:?\s*([^\n.!؟]{5,60})',
-            r'فرصة\s*:?\s*([^\n.!؟]{5,60})',
-        ]
-
-        for pat in patterns:
-            match = re.search(pat, text, re.I)
+        for pat in _TITLE_PATTERNS:
+            match = pat.search(text)
             if match:
-                title = match.group(1).strip()
-                title = re.sub(r'https?://\S+', '', title).strip()
+                title = _strip_urls(match.group(1).strip()).strip()
                 if len(title) > 5:
                     return title[:100]
 
@@ -410,56 +533,39 @@ class TelegramJobsSpider(scrapy.Spider):
         for line in text.split('\n'):
             line = line.strip()
             if len(line) > 10 and len(line) < 150:
-                return re.sub(r'https?://\S+', '', line).strip()[:100]
+                return _strip_urls(line).strip()[:100]
 
         return text[:100]
 
-    def _extract_location(self, text, default_region='Unknown'):
-        """Extract location from message text"""
-        if re.search(r'\b(remote|عن\s*بعد|من\s*المنزل|anywhere|worldwide)\b', text, re.I):
-            if re.search(r'\b(UAE|Dubai|دبي|الامارات)\b', text, re.I):
-                return 'Remote - UAE'
-            if re.search(r'\b(Europe|EU|UK|Germany)\b', text, re.I):
-                return 'Remote - Europe'
-            if re.search(r'\b(Egypt|مصر|القاهرة)\b', text, re.I):
-                return 'Remote - Egypt'
-            return 'Remote'
+    def _scan_tags(self, text):
+        """Collect location / job-type tags from message text in one pass"""
+        return _TAGGER.tags(text)
 
-        location_map = [
-            (r'\b(Dubai|UAE|دبي|الامارات|Abu\s*Dhabi)\b', 'UAE'),
-            (r'\b(Cairo|القاهرة|Egypt|مصر|Alexandria|اسكندرية)\b', 'Egypt'),
-            (r'\b(Riyadh|Saudi|السعودية)\b', 'Saudi Arabia'),
-            (r'\b(London|UK)\b', 'UK'),
-            (r'\b(Berlin|Germany)\b', 'Germany'),
-        ]
+    def _extract_location(self, tags, default_region='Unknown'):
+        """Extract location from the message's tags"""
+        if ('remote', None) in tags:
+            for loc in _REMOTE_REGION_ORDER:
+                if ('remote_region', loc) in tags:
+                    return loc
+            return 'Remote'
 
-        for pat, loc in location_map:
-            if re.search(pat, text, re.I):
+        for loc in _LOCATION_ORDER:
+            if ('location', loc) in tags:
                 return loc
 
         return default_region if default_region != 'Unknown' else 'Not specified'
 
-    def _extract_job_type(self, text):
-        """Extract job type from message text"""
-        if re.search(r'\b(freelance|فريلانس|contract|project[-\s]based)\b', text, re.I):
-            return 'Freelance'
-        if re.search(r'\b(part[-\s]?time|دوام\s*جزئي)\b', text, re.I):
-            return 'Part Time'
-        if re.search(r'\b(remote|عن\s*بعد)\b', text, re.I):
-            return 'Remote'
-        if re.search(r'\b(full[-\s]?time|دوام\s*كامل)\b', text, re.I):
-            return 'Full Time'
+    def _extract_job_type(self, tags):
+        """Extract job type from the message's tags"""
+        for job_type in _JOB_TYPE_ORDER:
+            if ('type', job_type) in tags:
+                return job_type
         return 'Not specified'
 
     def _extract_company(self, text):
         """Try to extract company name from message"""
-        patterns = [
-            r'(?:at|@|in|company:?)\s+([A-Z][A-Za-z0-9\s&.]{2,40}?)(?:\s+is|\s+-|\s+\(|,|\n)',
-            r'(?:شركة|في)\s+([^\n,]{3,40}?)(?:\s+تطلب|\s+محتاجة|\s+-)',
-        ]
-
-        for pat in patterns:
-            match = re.search(pat, text, re.I)
+        for pat in _COMPANY_PATTERNS:
+            match = pat.search(text)
             if match:
                 name = match.group(1).strip()
                 if 3 < len(name) < 50:
@@ -469,31 +575,16 @@ class TelegramJobsSpider(scrapy.Spider):
 
     def _extract_channel_handle(self, url):
         """Extract channel handle from t.me URL"""
-        # Match: t.me/channelname or t.me/s/channelname or t.me/channelname/123
-        match = re.search(r't\.me/(?:s/)?([a-zA-Z][\w]{2,30})', url)
-        if match:
-            handle = match.group(1)
-            # Skip common non-channel paths
-            skip_words = ['share', 'addstickers', 'joinchat', 'proxy', 'socks']
-            if handle.lower() not in skip_words:
-                return handle
-        return None
+        return _channel_handle(url)
 
     def _clean_channel_name(self, title):
         """Clean channel name from search result title"""
-        if title:
-            name = re.sub(r'\s*[-–|]\s*Telegram.*$', '', title, flags=re.I)
-            return name.strip()[:60] if name.strip() else 'Telegram Channel'
-        return 'Telegram Channel'
+        return _channel_name(title)
 
     def _find_apply_link(self, urls):
         """Find best application link from message URLs"""
-        job_domains = ['greenhouse', 'lever', 'workday', 'ashbyhq', 'bamboohr',
-                       'jobs', 'careers', 'apply', 'hire', 'linkedin.com/jobs',
-                       'wuzzuf', 'indeed', 'bayt']
-
         for url in urls:
-            if any(domain in url.lower() for domain in job_domains):
+            if _JOB_LINK_RE.search(url):
                 return url
 
         return urls[0] if urls else None
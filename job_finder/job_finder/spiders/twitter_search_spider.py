@@ -17,6 +17,9 @@ How it works:
 
   With API key: Also runs keyword searches via Twitter API v2 for
   broader coverage. Set TWITTER_BEARER_TOKEN in settings.py.
+
+  Run with -s JOBDIR=crawls/twitter_jobs to remember seen tweets between
+  runs (only new tweets are yielded on later crawls).
 """
 
 import scrapy
@@ -25,9 +28,164 @@ import json
 from urllib.parse import urlencode, quote_plus
 import logging
 from job_finder.cv_config import RELEVANT_KEYWORDS, is_relevant_social
+from job_finder.bloom import RotatingBloomFilter
+from job_finder.matcher import TermTagger
+
+try:
+    # Optional fast JSON decoder; orjson.JSONDecodeError subclasses json's
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Pre-compiled patterns (built once at import, used for every tweet)
+# ═══════════════════════════════════════════════════════════════════════════
+
+_ARABIC_RE = re.compile(r'[\u0600-\u06FF]')
+_NEXT_DATA_TAG = b'<script id="__NEXT_DATA__"'
+_URL_RE = re.compile(r'https?://\S+')
+
+_TITLE_PATTERNS = [
+    re.compile(p, re.I) for p in [
+        r'(?:hiring|looking\s*for)\s*(?:a\s+)?([^.!?\n]{10,80})',
+        r'(?:open\s*)?(?:role|position):\s*([^.!?\n]{10,80})',
+        r'(?:مطلوب|نبحث عن|نحتاج)\s+([^.!?\n]{10,80})',
+        r'(?:وظيفة|فرصة عمل):\s*([^.!?\n]{10,80})',
+        r'^([^.!?\n]{10,100})',
+    ]
+]
+
+# Location / job-type terms, scanned in one pass. Each named term sets one or
+# more (kind, value) tags; the precedence lists below then pick the result.
+_SAUDI_REMOTE = ('remote_region', 'Remote - Saudi Arabia')
+_UAE_REMOTE = ('remote_region', 'Remote - UAE')
+_EUROPE_REMOTE = ('remote_region', 'Remote - Europe')
+_TAG_TERMS = [
+    ('remote', r'remote|عن بعد|ريموت', [('remote', None), ('type', 'Remote')]),
+    ('remote_any', r'anywhere|worldwide|global', [('remote', None)]),
+    # "Saudi Arabia" before "Saudi": both words count for the remote region
+    ('saudi_arabia', r'Saudi\s+Arabia', [_SAUDI_REMOTE, ('location', 'Saudi Arabia')]),
+    ('saudiarabia', r'SaudiArabia', [('location', 'Saudi Arabia')]),
+    ('saudi', r'Saudi', [_SAUDI_REMOTE]),
+    ('ksa', r'KSA|السعودية', [_SAUDI_REMOTE, ('location', 'Saudi Arabia')]),
+    ('riyadh_ar', r'الرياض', [_SAUDI_REMOTE, ('location', 'Saudi Arabia - Riyadh')]),
+    ('riyadh', r'Riyadh', [('location', 'Saudi Arabia - Riyadh')]),
+    ('jeddah', r'Jeddah|جدة|جده', [('location', 'Saudi Arabia - Jeddah')]),
+    ('neom', r'NEOM|نيوم', [('location', 'Saudi Arabia - NEOM')]),
+    ('dammam', r'Dammam|الدمام', [('location', 'Saudi Arabia - Dammam')]),
+    ('dubai', r'Dubai|دبي', [_UAE_REMOTE, ('location', 'UAE - Dubai')]),
+    ('abu_dhabi', r'Abu\s*Dhabi|ابوظبي|أبوظبي', [('location', 'UAE - Abu Dhabi')]),
+    ('sharjah', r'Sharjah|الشارقة', [('location', 'UAE - Sharjah')]),
+    ('uae', r'UAE|الامارات', [_UAE_REMOTE, ('location', 'UAE')]),
+    ('uae_hamza', r'الإمارات', [('location', 'UAE')]),
+    ('qatar', r'Qatar|Doha|قطر|الدوحة', [('location', 'Qatar')]),
+    ('kuwait', r'Kuwait|الكويت', [('location', 'Kuwait')]),
+    ('bahrain', r'Bahrain|البحرين|المنامة', [('location', 'Bahrain')]),
+    ('oman', r'Oman|عمان|مسقط', [('location', 'Oman')]),
+    ('cairo', r'Cairo|القاهرة', [('location', 'Egypt - Cairo')]),
+    ('alexandria', r'Alexandria|الاسكندرية', [('location', 'Egypt - Alexandria')]),
+    ('egypt', r'Egypt|مصر', [('location', 'Egypt')]),
+    ('europe', r'Europe|EU', [_EUROPE_REMOTE]),
+    ('uk', r'UK', [_EUROPE_REMOTE, ('location', 'UK')]),
+    ('london', r'London', [('location', 'UK')]),
+    ('germany', r'Germany', [_EUROPE_REMOTE, ('location', 'Germany')]),
+    ('berlin', r'Berlin', [('location', 'Germany')]),
+    ('netherlands', r'Amsterdam|Netherlands', [('location', 'Netherlands')]),
+    ('freelance', r'freelance|contract|gig|فريلانس|عمل حر|مستقل', [('type', 'Freelance')]),
+    ('part_time', r'part[-\s]?time|دوام جزئي', [('type', 'Part Time')]),
+    ('full_time', r'full[-\s]?time|دوام كامل', [('type', 'Full Time')]),
+]
+_TAGGER = TermTagger(_TAG_TERMS)
+
+_REMOTE_REGION_ORDER = ['Remote - UAE', 'Remote - Saudi Arabia', 'Remote - Europe']
+_LOCATION_ORDER = [
+    'Saudi Arabia - Riyadh', 'Saudi Arabia - Jeddah', 'Saudi Arabia - NEOM',
+    'Saudi Arabia - Dammam', 'Saudi Arabia', 'UAE - Dubai', 'UAE - Abu Dhabi',
+    'UAE - Sharjah', 'UAE', 'Qatar', 'Kuwait', 'Bahrain', 'Oman', 'Egypt - Cairo',
+    'Egypt - Alexandria', 'Egypt', 'UK', 'Germany', 'Netherlands',
+]
+_JOB_TYPE_ORDER = ['Freelance', 'Part Time', 'Remote', 'Full Time']
+
+# Twitter API v2 recent search: fixed part of every query's parameters
+_API_SEARCH_URL = 'https://api.twitter.com/2/tweets/search/recent'
+_API_QUERY_MAX_LEN = 512
+# Page size bounds of recent search, and the tweets each packed sub-query may
+# pull per run (what one unpacked query used to get from a 50-result page)
+_API_PAGE_MIN, _API_PAGE_MAX = 10, 100
+_API_RESULTS_PER_QUERY = 50
+_API_SEARCH_PARAMS = {
+    'tweet.fields': 'created_at,author_id,public_metrics,entities,context_annotations',
+    'user.fields': 'name,username,verified',
+    'expansions': 'author_id',
+    'sort_order': 'recency',
+}
+
+
+def _pack_queries(queries, suffix, max_len=_API_QUERY_MAX_LEN):
+    """Greedily OR queries into groups whose packed query fits max_len"""
+    groups, current = [], []
+    for query in queries:
+        if current and len(_packed_query(current + [query], suffix)) > max_len:
+            groups.append(current)
+            current = []
+        current.append(query)
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _packed_query(queries, suffix):
+    """'(q1) OR (q2) ...' with the shared filters applied to the whole group"""
+    if len(queries) == 1:
+        return f'{queries[0]} {suffix}'
+    return '(' + ' OR '.join(f'({query})' for query in queries) + f') {suffix}'
+
+
+def _next_data(body):
+    """Raw __NEXT_DATA__ JSON bytes sliced out of a page body, or None"""
+    start = body.find(_NEXT_DATA_TAG)
+    if start == -1:
+        return None
+    start = body.find(b'>', start) + 1
+    end = body.find(b'</script>', start)
+    if not start or end == -1:
+        return None
+    return body[start:end]
+
+
+def _expanded_urls(tweet):
+    """Non-empty expanded URLs from a tweet's url entities (lazy)"""
+    entities = tweet.get('entities', {}).get('urls', ())
+    return (url for url in (entity.get('expanded_url') for entity in entities) if url)
+
+
+def _unique_ci(values):
+    """Drop case-insensitive repeats (handles, search terms), keeping list order"""
+    seen = set()
+    unique = []
+    for value in values:
+        key = value.lower()
+        if key not in seen:
+            seen.add(key)
+            unique.append(value)
+    return unique
+
+
+# ATS / job-board hints in a tweet's outbound links (plain substrings)
+_JOB_LINK_RE = re.compile(
+    '|'.join(map(re.escape, [
+        'greenhouse', 'lever', 'workday', 'ashbyhq', 'bamboohr', 'jobs',
+        'careers', 'apply', 'hire', 'linkedin.com/jobs', 'bayt.com',
+        'gulftalent', 'naukrigulf', 'wuzzuf', 'indeed',
+    ])),
+    re.IGNORECASE
+)
+
+_TWEET_URL_RE = re.compile(r'(?:twitter\.com|x\.com)/(\w+)/status/(\d+)')
+_PROFILE_URL_RE = re.compile(r'(?:twitter\.com|x\.com)/(\w+)')
+
 
 class TwitterSearchSpider(scrapy.Spider):
     """
@@ -122,12 +280,18 @@ class TwitterSearchSpider(scrapy.Spider):
     ]
 
     custom_settings = {
-        'DOWNLOAD_DELAY': 4,
-        'CONCURRENT_REQUESTS': 2,
-        'CONCURRENT_REQUESTS_PER_DOMAIN': 1,
+        'DOWNLOAD_DELAY': 3,
+        # Up to 3 in flight per host (syndication / API); AutoThrottle aims
+        # for 2 and backs off on latency, the retry middleware on 429s.
+        # The next request comes from the least busy host, so API searches
+        # are not queued behind the 40+ syndication timelines
+        'CONCURRENT_REQUESTS': 6,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 3,
+        'SCHEDULER_PRIORITY_QUEUE': 'scrapy.pqueues.DownloaderAwarePriorityQueue',
         'AUTOTHROTTLE_ENABLED': True,
         'AUTOTHROTTLE_START_DELAY': 3,
         'AUTOTHROTTLE_MAX_DELAY': 20,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 2.0,
         'RETRY_TIMES': 2,
         'RETRY_HTTP_CODES': [429, 500, 502, 503],
     }
@@ -135,13 +299,28 @@ class TwitterSearchSpider(scrapy.Spider):
     def __init__(self, bearer_token=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._bearer_token_arg = bearer_token
-        self.seen_tweets = set()
+        # Tweet ids across all timelines and searches (rotated when full, as
+        # with JOBDIR it is kept from run to run)
+        self.seen_tweets = RotatingBloomFilter(capacity=100_000, error_rate=1e-6)
 
     def start_requests(self):
         """Generate requests - syndication profiles + optional API search"""
         # Access settings here (not in __init__) because Scrapy sets them later
+        # With JOBDIR set, Scrapy's SpiderState extension persists self.state
+        # between runs: keep the seen-tweet filter there so a restarted crawl
+        # skips tweets it already yielded
+        state = getattr(self, 'state', None)
+        if state is not None:
+            self.seen_tweets = state.setdefault('seen_tweets', self.seen_tweets)
+
         self.bearer_token = self._bearer_token_arg or self.settings.get('TWITTER_BEARER_TOKEN')
         self.use_api = bool(self.bearer_token)
+        # Same auth headers for every API query; connections to api.twitter.com
+        # are kept alive (DEFAULT_REQUEST_HEADERS) and pooled by Scrapy's agent
+        self._api_headers = {
+            'Authorization': f'Bearer {self.bearer_token}',
+            'Content-Type': 'application/json',
+        }
 
         # MODE 1: If API token available, run keyword searches
         if self.use_api:
@@ -161,37 +340,46 @@ class TwitterSearchSpider(scrapy.Spider):
 
     def _api_requests(self):
         """Generate Twitter API v2 search requests"""
-        for query in self.search_queries:
-            has_arabic = bool(re.search(r'[\u0600-\u06FF]', query))
-            lang_filter = 'lang:ar' if has_arabic else 'lang:en'
-
-            params = {
-                'query': f'{query} -is:retweet {lang_filter}',
-                'max_results': 50,
-                'tweet.fields': 'created_at,author_id,public_metrics,entities,context_annotations',
-                'user.fields': 'name,username,verified',
-                'expansions': 'author_id',
-                'sort_order': 'recency',
-            }
-            url = f"https://api.twitter.com/2/tweets/search/recent?{urlencode(params)}"
-            yield scrapy.Request(
-                url,
-                callback=self.parse_api_results,
-                headers={
-                    'Authorization': f'Bearer {self.bearer_token}',
-                    'Content-Type': 'application/json',
-                },
-                meta={'query': query},
-                errback=self.handle_error,
-                dont_filter=True,
-            )
+        # Sibling queries share one request per language as '(q1) OR (q2) ...'
+        # up to the API's query length. Each group pages on (next_token) until
+        # it has fetched as many tweets as its queries got one by one
+        english, arabic = [], []
+        for query in _unique_ci(self.search_queries):
+            (arabic if _ARABIC_RE.search(query) else english).append(query)
+
+        for queries, lang_filter in ((english, 'lang:en'), (arabic, 'lang:ar')):
+            suffix = f'-is:retweet {lang_filter}'
+            for group in _pack_queries(queries, suffix):
+                yield self._api_search_request({
+                    # The API does not say which OR branch matched, so items
+                    # record the whole group that was searched
+                    'query': ' | '.join(group),
+                    'search_query': _packed_query(group, suffix),
+                    'budget': _API_RESULTS_PER_QUERY * len(group),
+                    'fetched': 0,
+                })
+
+    def _api_search_request(self, meta, next_token=None):
+        """One recent-search page for a packed group, sized to its remaining budget"""
+        page_size = min(_API_PAGE_MAX, max(_API_PAGE_MIN, meta['budget'] - meta['fetched']))
+        params = {'query': meta['search_query'], 'max_results': page_size, **_API_SEARCH_PARAMS}
+        if next_token:
+            params['next_token'] = next_token
+        return scrapy.Request(
+            f"{_API_SEARCH_URL}?{urlencode(params)}",
+            callback=self.parse_api_results,
+            headers=self._api_headers,
+            meta=meta,
+            errback=self.handle_error,
+            dont_filter=True,
+        )
 
     def parse_api_results(self, response):
         """Parse Twitter API v2 search results"""
         query = response.meta.get('query', 'unknown')
 
         try:
-            data = json.loads(response.text)
+            data = json_loads(response.body)
         except json.JSONDecodeError:
             logger.error(f"Failed to parse Twitter API response for: {query}")
             return
@@ -221,11 +409,10 @@ class TwitterSearchSpider(scrapy.Spider):
             display_name = user.get('name', username)
             metrics = tweet.get('public_metrics', {})
 
-            urls = []
-            for url_entity in tweet.get('entities', {}).get('urls', []):
-                expanded = url_entity.get('expanded_url', '')
-                if expanded and 'twitter.com' not in expanded:
-                    urls.append(expanded)
+            urls = [
+                url for url in _expanded_urls(tweet)
+                if 'twitter.com' not in url
+            ]
 
             yield self._build_item(
                 text=text,
@@ -238,6 +425,17 @@ class TwitterSearchSpider(scrapy.Spider):
                 query=query,
             )
 
+        # Next page of this group, until its budget is used up
+        next_token = data.get('meta', {}).get('next_token')
+        fetched = response.meta.get('fetched', 0) + len(tweets)
+        if next_token and fetched < response.meta.get('budget', 0):
+            yield self._api_search_request({
+                'query': query,
+                'search_query': response.meta['search_query'],
+                'budget': response.meta['budget'],
+                'fetched': fetched,
+            }, next_token)
+
     # =========================================================================
     # MODE 2: Twitter Syndication (No auth needed! Primary method)
     # =========================================================================
@@ -245,7 +443,7 @@ class TwitterSearchSpider(scrapy.Spider):
     def _syndication_requests(self):
         """Scrape job account timelines via Twitter's syndication endpoint.
         Returns up to 99 tweets per account, rendered as server-side HTML+JSON."""
-        for account in self.job_accounts:
+        for account in _unique_ci(self.job_accounts):
             url = f"https://syndication.twitter.com/srv/timeline-profile/screen-name/{account}"
             yield scrapy.Request(
                 url,
@@ -263,19 +461,21 @@ class TwitterSearchSpider(scrapy.Spider):
             logger.warning(f"Rate limited on @{account} - will retry")
             return
 
-        # Extract __NEXT_DATA__ JSON embedded in the HTML
-        script = response.css('script#__NEXT_DATA__::text').get()
-        if not script:
-            # Fallback: regex extraction
-            match = re.search(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', response.text, re.DOTALL)
-            script = match.group(1) if match else None
+        # Extract __NEXT_DATA__ JSON embedded in the HTML. Slicing the raw bytes
+        # finds it without decoding the page or building its DOM; the selector
+        # is only needed when the tag is written differently (e.g. other
+        # attribute order), never for pages without the marker (errors, empty)
+        body = response.body
+        script = _next_data(body)
+        if not script and b'__NEXT_DATA__' in body:
+            script = response.css('script#__NEXT_DATA__::text').get()
 
         if not script:
             logger.debug(f"No syndication data for @{account}")
             return
 
         try:
-            data = json.loads(script)
+            data = json_loads(script)
         except json.JSONDecodeError:
             logger.error(f"Failed to parse syndication JSON for @{account}")
             return
@@ -311,11 +511,10 @@ class TwitterSearchSpider(scrapy.Spider):
             display_name = user.get('name', username)
 
             # Extract URLs from tweet entities
-            urls = []
-            for url_entity in tweet.get('entities', {}).get('urls', []):
-                expanded = url_entity.get('expanded_url', '')
-                if expanded and 'twitter.com' not in expanded and 'x.com' not in expanded:
-                    urls.append(expanded)
+            urls = [
+                url for url in _expanded_urls(tweet)
+                if 'twitter.com' not in url and 'x.com' not in url
+            ]
 
             # Get engagement metrics
             likes = tweet.get('favorite_count', 0) or 0
@@ -354,8 +553,9 @@ class TwitterSearchSpider(scrapy.Spider):
     def _build_item(self, text, username, display_name, tweet_id,
                     apply_link, likes, retweets, query):
         """Build a standardized job item from tweet data"""
-        location = self._extract_location(text)
-        job_type = self._extract_job_type(text)
+        tags = _TAGGER.tags(text)
+        location = self._extract_location(text, tags)
+        job_type = self._extract_job_type(text, tags)
         tweet_url = f"https://x.com/{username}/status/{tweet_id}" if tweet_id else ''
         title = self._extract_title(text)
 
@@ -377,95 +577,55 @@ class TwitterSearchSpider(scrapy.Spider):
 
     def _extract_title(self, text):
         """Extract a clean job title from tweet text (English + Arabic)"""
-        patterns = [
-            r'(?:hiring|looking\s*for)\s*(?:a\s+)?([^.!?\n]{10,80})',
-            r'(?:open\s*)?(?:role|position):\s*([^.!?\n]{10,80})',
-            r'(?:مطلوب|نبحث عن|نحتاج)\s+([^.!?\n]{10,80})',
-            r'(?:وظيفة|فرصة عمل):\s*([^.!?\n]{10,80})',
-            r'^([^.!?\n]{10,100})',
-        ]
-
-        for pat in patterns:
-            match = re.search(pat, text, re.I)
+        for pat in _TITLE_PATTERNS:
+            match = pat.search(text)
             if match:
                 title = match.group(1).strip()
-                title = re.sub(r'https?://\S+', '', title).strip()
+                title = _URL_RE.sub('', title).strip()
                 if len(title) > 10:
                     return title[:100]
 
         first_line = text.split('\n')[0][:100]
-        return re.sub(r'https?://\S+', '', first_line).strip() or text[:100]
+        return _URL_RE.sub('', first_line).strip() or text[:100]
 
-    def _extract_location(self, text):
+    def _extract_location(self, text, tags=None):
         """Extract location from tweet text (expanded for Gulf region)"""
-        if re.search(r'\b(remote|anywhere|worldwide|global|عن بعد|ريموت)\b', text, re.I):
-            if re.search(r'\b(UAE|Dubai|دبي|الامارات)\b', text, re.I):
-                return 'Remote - UAE'
-            if re.search(r'\b(Saudi|KSA|السعودية|الرياض)\b', text, re.I):
-                return 'Remote - Saudi Arabia'
-            if re.search(r'\b(Europe|EU|UK|Germany)\b', text, re.I):
-                return 'Remote - Europe'
+        tags = _TAGGER.tags(text) if tags is None else tags
+        if ('remote', None) in tags:
+            for loc in _REMOTE_REGION_ORDER:
+                if ('remote_region', loc) in tags:
+                    return loc
             return 'Remote'
 
-        location_map = [
-            (r'\b(Riyadh|الرياض)\b', 'Saudi Arabia - Riyadh'),
-            (r'\b(Jeddah|جدة|جده)\b', 'Saudi Arabia - Jeddah'),
-            (r'\b(NEOM|نيوم)\b', 'Saudi Arabia - NEOM'),
-            (r'\b(Dammam|الدمام)\b', 'Saudi Arabia - Dammam'),
-            (r'\b(Saudi\s*Arabia|KSA|السعودية)\b', 'Saudi Arabia'),
-            (r'\b(Dubai|دبي)\b', 'UAE - Dubai'),
-            (r'\b(Abu\s*Dhabi|ابوظبي|أبوظبي)\b', 'UAE - Abu Dhabi'),
-            (r'\b(Sharjah|الشارقة)\b', 'UAE - Sharjah'),
-            (r'\b(UAE|الامارات|الإمارات)\b', 'UAE'),
-            (r'\b(Qatar|Doha|قطر|الدوحة)\b', 'Qatar'),
-            (r'\b(Kuwait|الكويت)\b', 'Kuwait'),
-            (r'\b(Bahrain|البحرين|المنامة)\b', 'Bahrain'),
-            (r'\b(Oman|عمان|مسقط)\b', 'Oman'),
-            (r'\b(Cairo|القاهرة)\b', 'Egypt - Cairo'),
-            (r'\b(Alexandria|الاسكندرية)\b', 'Egypt - Alexandria'),
-            (r'\b(Egypt|مصر)\b', 'Egypt'),
-            (r'\b(London|UK)\b', 'UK'),
-            (r'\b(Berlin|Germany)\b', 'Germany'),
-            (r'\b(Amsterdam|Netherlands)\b', 'Netherlands'),
-        ]
-
-        for pat, loc in location_map:
-            if re.search(pat, text, re.I):
+        for loc in _LOCATION_ORDER:
+            if ('location', loc) in tags:
                 return loc
 
         return 'Not specified'
 
-    def _extract_job_type(self, text):
+    def _extract_job_type(self, text, tags=None):
         """Extract job type from tweet text (English + Arabic)"""
-        if re.search(r'\b(freelance|contract|gig|فريلانس|عمل حر|مستقل)\b', text, re.I):
-            return 'Freelance'
-        if re.search(r'\b(part[-\s]?time|دوام جزئي)\b', text, re.I):
-            return 'Part Time'
-        if re.search(r'\b(remote|عن بعد|ريموت)\b', text, re.I):
-            return 'Remote'
-        if re.search(r'\b(full[-\s]?time|دوام كامل)\b', text, re.I):
-            return 'Full Time'
+        tags = _TAGGER.tags(text) if tags is None else tags
+        for job_type in _JOB_TYPE_ORDER:
+            if ('type', job_type) in tags:
+                return job_type
         return 'Not specified'
 
     def _find_apply_link(self, urls):
         """Find the best application link from a list of URLs"""
-        job_domains = ['greenhouse', 'lever', 'workday', 'ashbyhq', 'bamboohr',
-                       'jobs', 'careers', 'apply', 'hire', 'linkedin.com/jobs',
-                       'bayt.com', 'gulftalent', 'naukrigulf', 'wuzzuf', 'indeed']
-
         for url in urls:
-            if any(domain in url.lower() for domain in job_domains):
+            if _JOB_LINK_RE.search(url):
                 return url
 
         return urls[0] if urls else None
 
     def _parse_twitter_url(self, url):
         """Extract username and tweet ID from a Twitter/X URL"""
-        match = re.search(r'(?:twitter\.com|x\.com)/(\w+)/status/(\d+)', url)
+        match = _TWEET_URL_RE.search(url)
         if match:
             return match.group(1), match.group(2)
 
-        match = re.search(r'(?:twitter\.com|x\.com)/(\w+)', url)
+        match = _PROFILE_URL_RE.search(url)
         if match:
             return match.group(1), ''
 
@@ -1,6 +1,5 @@
 
 import scrapy
-import re
 from urllib.parse import urlencode
 from job_finder.cv_config import RELEVANT_KEYWORDS, SEARCH_KEYWORDS, is_relevant
 
@@ -16,6 +15,11 @@ class WuzzufSpider(scrapy.Spider):
     # CV-based keywords for filtering
     relevant_keywords = RELEVANT_KEYWORDS
 
+    # Result pages per keyword (?start=0, 1, 2...). Each page is requested
+    # once the one before it had job cards, so short or empty searches stop
+    # early; the keywords themselves are still fetched concurrently
+    max_pages = 5
+
     def start_requests(self):
         for keyword in self.keywords:
             params = {
@@ -25,7 +29,7 @@ class WuzzufSpider(scrapy.Spider):
                 # e.g., location, type etc if known. For now, general search.
             }
             url = f"{self.base_url}{urlencode(params)}"
-            yield scrapy.Request(url, callback=self.parse, meta={'keyword': keyword})
+            yield scrapy.Request(url, callback=self.parse, meta={'keyword': keyword, 'search_url': url, 'page': 0})
 
 
 
@@ -47,11 +51,8 @@ class WuzzufSpider(scrapy.Spider):
             
 
             # Strict Filtering: Check if title is relevant
-            # Use regex for word boundaries to avoid partial matches like "Waiter" (AI) or "Sustainability" (AI)
-            
-            # Create a combined regex pattern: \b(Designer|3D|...)\b
-            pattern = re.compile(r'\b(' + '|'.join(self.relevant_keywords) + r')\b', re.IGNORECASE)
-            
+            # is_relevant uses cv_config's precompiled word-boundary patterns to avoid
+            # partial matches like "Waiter" (AI) or "Sustainability" (AI)
             if not is_relevant(title=title):
                 self.logger.info(f"Skipping irrelevant title: {title}")
                 continue
@@ -73,39 +74,11 @@ class WuzzufSpider(scrapy.Spider):
             
             yield item
 
-        
-        # Pagination: Look for a "Next" button. 
-        # In the HTML, there are buttons with class 'css-1y7kjgo' or links ?start=X
-        # A simple way is to check the 'start' param and increment if we found jobs.
-        # But let's check for the actual 'next' element if possible.
-        # Inspecting HTML for pagination: <button class="css-1y7kjgo ..."><a href="...?start=1">2</a></button>
-        # The 'next' button usually is the one after the current active one, or just the last one.
-        # Wuzzuf pagination often works by `start=N*pageSize`. 
-        # Let's try to find the 'next' page link generically.
-        
-        current_url = response.url
-        if "start=" in current_url:
-            current_start = int(current_url.split("start=")[1].split("&")[0])
-            next_start = current_start + 1 # Wuzzuf pages seem to be 0, 1, 2... based on the links ?start=1, ?start=2
-        else:
-            current_start = 0
-            next_start = 1
-            
-        # Limit pages to avoid infinite loops for this test
-        if next_start < 5 and job_cards:
-             # Construct next URL
-             if "start=" in current_url:
-                 next_page = current_url.replace(f"start={current_start}", f"start={next_start}")
-             else:
-                 next_page = f"{current_url}&start={next_start}"
-                 
-             yield scrapy.Request(next_page, callback=self.parse, meta=response.meta)
-
-        next_page = response.css('a.css-1246l8h::attr(href)').get() # Generic 'Next' arrow class?
-        # Or usually it's easier to increment 'start' param programmatically or follow specific link.
-        
-        # Let's try to follow the 'Next' button if found in typical Wuzzuf pagination
-        # (This selector is an educated guess based on Wuzzuf structure, might need adjustment)
-        if next_page:
-             yield response.follow(next_page, callback=self.parse, meta=response.meta)
-
+        # Next result page, only while pages still have job cards
+        page = response.meta.get('page', 0) + 1
+        if job_cards and page < self.max_pages:
+            yield scrapy.Request(
+                f"{response.meta['search_url']}&start={page}",
+                callback=self.parse,
+                meta={'keyword': response.meta['keyword'], 'search_url': response.meta['search_url'], 'page': page},
+            )
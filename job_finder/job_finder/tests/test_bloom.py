@@ -0,0 +1,75 @@
+import logging
+
+import pytest
+
+from job_finder.bloom import BloomFilter, RotatingBloomFilter
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self):
+        seen = BloomFilter(capacity=1000, error_rate=0.01)
+        keys = [f'https://example.com/job/{i}' for i in range(1000)]
+        for key in keys:
+            seen.add(key)
+        assert all(key in seen for key in keys)
+
+    def test_add_reports_new_keys(self):
+        seen = BloomFilter(capacity=100, error_rate=0.01)
+        assert seen.add('a')
+        assert not seen.add('a')
+        assert len(seen) == 1
+
+    def test_sizing(self):
+        seen = BloomFilter(capacity=1_000_000, error_rate=0.001)
+        # About 14.4 bits and 10 hashes per key at 0.1%
+        assert seen.num_bits == 14_377_588
+        assert seen.num_hashes == 10
+        assert len(seen._bits) == (seen.num_bits + 7) // 8
+
+    @pytest.mark.parametrize('error_rate', [0.01, 0.001])
+    def test_false_positive_rate_at_capacity(self, error_rate):
+        capacity = 20_000
+        seen = BloomFilter(capacity=capacity, error_rate=error_rate)
+        for i in range(capacity):
+            seen.add(f'seen-{i}')
+        probes = 50_000
+        false_positives = sum(f'unseen-{i}' in seen for i in range(probes))
+        # Deterministic hashes; allow generous slack over the target rate
+        assert false_positives / probes < error_rate * 2
+
+
+class TestRotatingBloomFilter:
+    def test_rotates_at_capacity(self, caplog):
+        seen = RotatingBloomFilter(capacity=10, error_rate=0.001)
+        for i in range(10):
+            seen.add(f'old-{i}')
+        assert seen.previous is None
+        with caplog.at_level(logging.INFO, logger='job_finder.bloom'):
+            seen.add('new-0')
+        assert 'reached its capacity of 10 keys' in caplog.text
+        assert len(seen.previous) == 10
+        assert len(seen.current) == 1
+        assert len(seen) == 11
+        # The previous generation is still consulted
+        assert 'old-0' in seen
+        assert 'new-0' in seen
+
+    def test_forgets_oldest_generation(self):
+        seen = RotatingBloomFilter(capacity=10, error_rate=0.001)
+        for i in range(10):
+            seen.add(f'first-{i}')
+        for i in range(10):
+            seen.add(f'second-{i}')
+        seen.add('third-0')
+        assert 'second-0' in seen
+        assert not any(f'first-{i}' in seen for i in range(10))
+
+    def test_bounded_false_positive_rate(self):
+        capacity = 5_000
+        seen = RotatingBloomFilter(capacity=capacity, error_rate=0.001)
+        # Far past capacity: a single filter would be saturated by now
+        for i in range(capacity * 10):
+            seen.add(f'seen-{i}')
+        probes = 20_000
+        false_positives = sum(f'unseen-{i}' in seen for i in range(probes))
+        assert false_positives / probes < 0.001 * 4
@@ -0,0 +1,81 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from io import BytesIO
+
+import pytest
+
+from scrapy.exporters import JsonItemExporter, JsonLinesItemExporter
+from scrapy.item import Field, Item
+
+from job_finder import exporters
+from job_finder.exporters import OrjsonItemExporter, OrjsonLinesItemExporter
+
+
+class JobItem(Item):
+    title = Field()
+    link = Field()
+    salary = Field()
+    date_posted = Field()
+    scraped_at = Field()
+    tags = Field()
+
+
+ITEMS = [
+    JobItem(title='Senior 3D Artist', link='https://example.com/1', salary=Decimal('1500.50'),
+            date_posted=date(2026, 2, 17), scraped_at=datetime(2026, 2, 17, 17, 8, 8),
+            tags=['remote', 'CGI']),
+    {'title': 'مصمم جرافيك', 'link': 'https://example.com/2', 'salary': None, 'tags': []},
+    {'title': 'Quote " and \\ and \n newline', 'score': 1.25, 'nested': {'a': [1, 2]}},
+]
+
+
+def export(exporter_cls, items=ITEMS, **kwargs):
+    output = BytesIO()
+    exporter = exporter_cls(output, **kwargs)
+    exporter.start_exporting()
+    for item in items:
+        exporter.export_item(item)
+    exporter.finish_exporting()
+    return output.getvalue()
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def backend(request, monkeypatch):
+    if request.param == 'orjson':
+        if exporters.orjson is None:
+            pytest.skip('orjson is not installed')
+    else:
+        monkeypatch.setattr(exporters, 'orjson', None)
+    return request.param
+
+
+class TestOrjsonItemExporter:
+    @pytest.mark.parametrize('kwargs', [{}, {'indent': 0}, {'indent': 2}, {'indent': 4}])
+    def test_parses_like_scrapy(self, backend, kwargs):
+        assert json.loads(export(OrjsonItemExporter, **kwargs)) == json.loads(export(JsonItemExporter, **kwargs))
+
+    def test_same_bytes_with_indent_2(self, backend):
+        assert export(OrjsonItemExporter, indent=2) == export(JsonItemExporter, indent=2)
+
+    def test_empty_feed(self, backend):
+        assert json.loads(export(OrjsonItemExporter, items=[])) == []
+
+    def test_other_encoding_falls_back(self):
+        exporter = OrjsonItemExporter(BytesIO(), encoding='latin-1')
+        assert exporter._orjson_option is None
+        items = [{'title': 'Café designer', 'salary': 1.5}]
+        assert export(OrjsonItemExporter, items, encoding='latin-1') == export(
+            JsonItemExporter, items, encoding='latin-1')
+
+
+class TestOrjsonLinesItemExporter:
+    def test_parses_like_scrapy(self, backend):
+        ours = export(OrjsonLinesItemExporter).splitlines()
+        scrapy_lines = export(JsonLinesItemExporter).splitlines()
+        assert [json.loads(line) for line in ours] == [json.loads(line) for line in scrapy_lines]
+
+    def test_one_object_per_line(self, backend):
+        output = export(OrjsonLinesItemExporter, indent=2)
+        assert output.endswith(b'\n')
+        assert len(output.splitlines()) == len(ITEMS)
@@ -0,0 +1,61 @@
+from lxml import etree
+
+from json_to_xml import write_jobs_xml
+
+FIELDS = ['title', 'company', 'link', 'relevance_score']
+
+
+def parse(path):
+    return etree.parse(str(path)).getroot()
+
+
+class TestWriteJobsXml:
+    def test_jobs(self, tmp_path):
+        path = tmp_path / 'jobs.xml'
+        write_jobs_xml(str(path), [
+            {'title': 'UI Designer', 'company': 'Acme', 'link': 'https://example.com/1?a=1&b=2',
+             'relevance_score': 7, 'extra key': 'kept', '1bad': 'dropped', 'empty': ' '},
+            {'title': 'Animator <Senior>', 'company': None},
+        ], FIELDS)
+        root = parse(path)
+        assert root.tag == 'jobs'
+        assert root.get('total') == '2'
+        assert root.get('generated')
+        first, second = root.findall('job')
+        assert [(child.tag, child.text) for child in first] == [
+            ('title', 'UI Designer'),
+            ('company', 'Acme'),
+            ('link', 'https://example.com/1?a=1&b=2'),
+            ('relevance_score', '7'),
+            ('extra_key', 'kept'),
+        ]
+        assert [(child.tag, child.text) for child in second] == [('title', 'Animator <Senior>')]
+
+    def test_invalid_characters_are_stripped(self, tmp_path):
+        path = tmp_path / 'jobs.xml'
+        write_jobs_xml(str(path), [{'title': 'UI\x00 Desig\x0bner￾', 'company': 'تصميم'}], FIELDS)
+        job = parse(path).find('job')
+        assert job.findtext('title') == 'UI Designer'
+        assert job.findtext('company') == 'تصميم'
+
+    def test_layout(self, tmp_path):
+        path = tmp_path / 'jobs.xml'
+        write_jobs_xml(str(path), [{'title': 'UI Designer'}, {'title': 'Animator'}], FIELDS)
+        lines = path.read_text(encoding='utf-8').splitlines()
+        assert lines[0] == "<?xml version='1.0' encoding='utf-8'?>"
+        assert lines[2:] == [
+            '  <job>',
+            '    <title>UI Designer</title>',
+            '  </job>',
+            '  <job>',
+            '    <title>Animator</title>',
+            '  </job>',
+            '</jobs>',
+        ]
+
+    def test_no_jobs(self, tmp_path):
+        path = tmp_path / 'jobs.xml'
+        write_jobs_xml(str(path), [], FIELDS)
+        root = parse(path)
+        assert root.get('total') == '0'
+        assert len(root) == 0
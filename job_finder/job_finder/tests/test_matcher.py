@@ -0,0 +1,91 @@
+import pytest
+
+from job_finder import matcher
+from job_finder.matcher import KeywordMatcher, TermTagger
+
+
+@pytest.fixture(params=['ahocorasick', 'regex'])
+def backend(request, monkeypatch):
+    if request.param == 'ahocorasick':
+        if matcher.ahocorasick is None:
+            pytest.skip('pyahocorasick is not installed')
+    else:
+        monkeypatch.setattr(matcher, 'ahocorasick', None)
+    return request.param
+
+
+def make_matcher(**kwargs):
+    return KeywordMatcher(
+        {'keyword': ['UI', 'UX', '3D', 'Art Director', 'C++'], 'hiring': ['hiring', 'job'],
+         'arabic': ['وظيف']},
+        substring_groups=['arabic'], **kwargs
+    )
+
+
+class TestKeywordMatcher:
+    def test_backend(self, backend):
+        m = make_matcher()
+        assert (m._automaton is not None) == (backend == 'ahocorasick')
+
+    @pytest.mark.parametrize('text', [
+        'Senior UI designer',
+        'ui/ux lead',
+        '3D artist (remote)',
+        'Hiring: ART DIRECTOR',
+        'UX',
+        'C++ developer',
+    ])
+    def test_whole_word_hit(self, backend, text):
+        assert make_matcher().matches(text, 'keyword')
+
+    @pytest.mark.parametrize('text', [
+        'Build tools engineer',  # "ui" inside "Build"
+        'Guide writer',  # "ui" inside "Guide"
+        'UIKit developer',
+        '3Dprinting',
+        'art_director',  # underscore is a word character
+        '',
+    ])
+    def test_no_partial_word_hit(self, backend, text):
+        assert not make_matcher().matches(text, 'keyword')
+
+    def test_find_groups(self, backend):
+        m = make_matcher()
+        assert m.find_groups('We are hiring a UX writer') == {'keyword', 'hiring'}
+        assert m.find_groups('Hiring now') == {'hiring'}
+        assert m.find_groups('nothing here') == frozenset()
+
+    def test_find_groups_wanted(self, backend):
+        m = make_matcher()
+        assert m.find_groups('We are hiring a UX writer', ['hiring']) == {'hiring'}
+
+    def test_substring_group(self, backend):
+        m = make_matcher()
+        # Arabic stems match inside longer words ("الوظيفة")
+        assert m.matches('الوظيفة متاحة', 'arabic')
+        assert not m.matches('الوظيفة متاحة', 'keyword')
+
+    def test_keyword_in_several_groups(self, backend):
+        m = KeywordMatcher({'a': ['remote'], 'b': ['Remote', 'job']})
+        assert m.find_groups('Remote role') == {'a', 'b'}
+
+    def test_backends_agree(self, monkeypatch):
+        if matcher.ahocorasick is None:
+            pytest.skip('pyahocorasick is not installed')
+        texts = ['UI/UX', 'Build UI', 'builder', 'c++ and 3D', 'hiring-job', 'xUI', 'UI_x']
+        fast = make_matcher()
+        monkeypatch.setattr(matcher, 'ahocorasick', None)
+        slow = make_matcher()
+        for text in texts:
+            assert fast.find_groups(text) == slow.find_groups(text), text
+
+
+class TestTermTagger:
+    def test_tags(self):
+        tagger = TermTagger([
+            ('saudi_arabia', r'Saudi\s+Arabia', [('location', 'Saudi Arabia')]),
+            ('uae', r'UAE|Dubai', [('location', 'UAE'), ('remote_region', 'MENA')]),
+        ])
+        assert tagger.tags('Office in dubai') == {('location', 'UAE'), ('remote_region', 'MENA')}
+        assert tagger.tags('Riyadh, Saudi Arabia') == {('location', 'Saudi Arabia')}
+        assert tagger.tags('Dubaian') == set()
@@ -0,0 +1,168 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+from urllib.parse import urlparse
+
+import pytest
+
+from scrapy.http import Request, Response
+from scrapy.settings import Settings
+
+from job_finder import middlewares
+from job_finder.middlewares import ExponentialBackoffRetryMiddleware
+
+
+@pytest.fixture
+def mw():
+    return ExponentialBackoffRetryMiddleware(Settings())
+
+
+def response(**headers):
+    return Response('https://api.example.com/', status=429, headers=headers)
+
+
+class TestRetryAfter:
+    def test_missing(self, mw):
+        assert mw._get_retry_after(response()) is None
+
+    @pytest.mark.parametrize(('value', 'expected'), [
+        ('120', 120.0),
+        ('0', 0.0),
+        (' 7 ', 7.0),
+    ])
+    def test_delta_seconds(self, mw, value, expected):
+        assert mw._get_retry_after(response(**{'Retry-After': value})) == expected
+
+    def test_http_date(self, mw):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=90)
+        delay = mw._get_retry_after(response(**{'Retry-After': format_datetime(retry_at, usegmt=True)}))
+        # The date has one-second resolution
+        assert 88 <= delay <= 90
+
+    def test_http_date_in_the_past(self, mw):
+        value = 'Wed, 21 Oct 2015 07:28:00 GMT'
+        assert mw._get_retry_after(response(**{'Retry-After': value})) == 0.0
+
+    @pytest.mark.parametrize('value', ['soon', '-5', '1.5'])
+    def test_invalid(self, mw, value):
+        assert mw._get_retry_after(response(**{'Retry-After': value})) is None
+
+
+class TestRateLimitReset:
+    def test_missing(self, mw):
+        assert mw._get_rate_limit_reset(response()) is None
+
+    def test_epoch(self, mw):
+        reset = int(datetime.now(timezone.utc).timestamp()) + 300
+        delay = mw._get_rate_limit_reset(response(**{'X-Rate-Limit-Reset': str(reset)}))
+        assert 298 <= delay <= 300
+
+    def test_epoch_in_the_past(self, mw):
+        assert mw._get_rate_limit_reset(response(**{'X-Rate-Limit-Reset': '1000'})) == 0.0
+
+    @pytest.mark.parametrize('value', ['', 'later', '-1'])
+    def test_invalid(self, mw, value):
+        assert mw._get_rate_limit_reset(response(**{'X-Rate-Limit-Reset': value})) is None
+
+
+class StubDownloader:
+    """Per-host download slots, as the engine's downloader keys them"""
+
+    def __init__(self, **delays):
+        self.slots = {host: SimpleNamespace(delay=delay) for host, delay in delays.items()}
+
+    def get_slot_key(self, request):
+        return urlparse(request.url).hostname
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(middlewares.time, 'monotonic', lambda: now.value)
+    return now
+
+
+def held_mw(**delays):
+    mw = ExponentialBackoffRetryMiddleware(Settings({'RETRY_MAX_DELAY': 60}))
+    mw.crawler = SimpleNamespace(engine=SimpleNamespace(downloader=StubDownloader(**delays)))
+    return mw
+
+
+def slot(mw, host='api.example.com'):
+    return mw.crawler.engine.downloader.slots[host]
+
+
+class TestHoldSlotDelay:
+    def test_raises_delay(self, clock):
+        mw = held_mw(**{'api.example.com': 0.5})
+        mw._hold_slot_delay(Request('https://api.example.com/a'), 2.0, 30)
+        assert slot(mw).delay == 2.0
+        assert mw._held_slots == {'api.example.com': 1030.0}
+
+    def test_never_lowers_delay(self, clock):
+        mw = held_mw(**{'api.example.com': 3.0})
+        mw._hold_slot_delay(Request('https://api.example.com/a'), 1.0, 5)
+        assert slot(mw).delay == 3.0
+
+    def test_backoff(self, clock):
+        mw = held_mw(**{'api.example.com': 4.0})
+        mw._hold_slot_delay(Request('https://api.example.com/a'), 1.0, 1.0, backoff=1.5)
+        assert slot(mw).delay == 6.0
+
+    def test_capped_at_max_delay(self, clock):
+        mw = held_mw(**{'api.example.com': 50.0})
+        mw._hold_slot_delay(Request('https://api.example.com/a'), 1.0, 1.0, backoff=1.5)
+        assert slot(mw).delay == 60.0
+
+    def test_unknown_slot(self, clock):
+        mw = held_mw()
+        mw._hold_slot_delay(Request('https://api.example.com/a'), 5.0, 5.0)
+        assert mw._held_slots == {}
+
+    def test_process_request_while_held(self, clock):
+        mw = held_mw(**{'api.example.com': 1.0, 'other.example.com': 1.0})
+        mw._hold_slot_delay(Request('https://api.example.com/a'), 2.0, 10)
+
+        held = Request('https://api.example.com/b')
+        other = Request('https://other.example.com/b')
+        assert mw.process_request(held, None) is None
+        assert mw.process_request(other, None) is None
+        assert held.meta['autothrottle_dont_adjust_delay'] is True
+        assert 'autothrottle_dont_adjust_delay' not in other.meta
+
+        # Once the hold is over AutoThrottle may adjust the slot again
+        clock.value += 10
+        later = Request('https://api.example.com/c')
+        mw.process_request(later, None)
+        assert 'autothrottle_dont_adjust_delay' not in later.meta
+        assert mw._held_slots == {}
+
+
+class TestQuotaPacing:
+    def process(self, mw, remaining, reset_in):
+        request = Request('https://api.example.com/search')
+        reset = int(datetime.now(timezone.utc).timestamp() + reset_in)
+        response = Response(request.url, headers={
+            'X-Rate-Limit-Remaining': str(remaining), 'X-Rate-Limit-Reset': str(reset),
+        })
+        return asyncio.run(mw.process_response(request, response, None))
+
+    def test_paces_remaining_quota_over_window(self, clock):
+        mw = held_mw(**{'api.example.com': 1.0})
+        self.process(mw, remaining=2, reset_in=60)
+        # 3 requests over ~60s
+        assert 19 <= slot(mw).delay <= 20
+        assert 'api.example.com' in mw._held_slots
+
+    def test_does_not_speed_up_near_reset(self, clock):
+        # remaining=4 with 5s left paces at 1s: slower than the slot already is
+        mw = held_mw(**{'api.example.com': 3.0})
+        self.process(mw, remaining=4, reset_in=5)
+        assert slot(mw).delay == 3.0
+
+    def test_plenty_of_quota_left(self, clock):
+        mw = held_mw(**{'api.example.com': 1.0})
+        self.process(mw, remaining=100, reset_in=60)
+        assert slot(mw).delay == 1.0
+        assert mw._held_slots == {}
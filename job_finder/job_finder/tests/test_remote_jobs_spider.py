@@ -0,0 +1,211 @@
+import email.utils
+import json
+import time
+
+import pytest
+
+from scrapy.downloadermiddlewares.httpcache import HttpCacheMiddleware
+from scrapy.http import HtmlResponse, Request, Response
+from scrapy.utils.test import get_crawler
+
+from job_finder.httpcache import RFC2616IgnoreCodesPolicy
+from job_finder.spiders.remote_jobs_spider import RemoteJobsSpider, _Company
+
+
+class TestHttpCache:
+    @pytest.fixture
+    def mw(self, tmp_path):
+        crawler = get_crawler(RemoteJobsSpider, {'HTTPCACHE_DIR': str(tmp_path)})
+        crawler.spider = crawler._create_spider()
+        crawler.stats.open_spider()
+        mw = HttpCacheMiddleware.from_crawler(crawler)
+        mw.spider_opened(crawler.spider)
+        yield mw
+        mw.spider_closed(crawler.spider)
+        crawler.stats.close_spider()
+
+    def test_settings(self, mw):
+        settings = mw.crawler.settings
+        assert settings.getbool('HTTPCACHE_ENABLED')
+        assert settings.getint('HTTPCACHE_EXPIRATION_SECS') == 86400
+        assert isinstance(mw.policy, RFC2616IgnoreCodesPolicy)
+        assert type(mw.storage).__name__ == 'FilesystemCacheStorage'
+
+    def test_fresh_response_is_served_from_cache(self, mw):
+        request = Request('https://careers.example.com/jobs')
+        response = Response(request.url, body=b'jobs', headers={'Cache-Control': 'max-age=3600'})
+        assert mw.process_request(request) is None
+        mw.process_response(request, response)
+
+        cached = mw.process_request(request.copy())
+        assert cached is not None
+        assert cached.body == b'jobs'
+        assert 'cached' in cached.flags
+
+    def test_stale_response_is_revalidated(self, mw):
+        request = Request('https://careers.example.com/jobs')
+        response = Response(request.url, body=b'jobs', headers={
+            'ETag': '"v1"',
+            'Date': email.utils.formatdate(time.time() - 7200, usegmt=True),
+            'Cache-Control': 'max-age=60',
+        })
+        mw.process_request(request)
+        mw.process_response(request, response)
+
+        # Stale: the request goes out again, now conditional on the ETag
+        revalidate = request.copy()
+        assert mw.process_request(revalidate) is None
+        assert revalidate.headers.get('If-None-Match') == b'"v1"'
+
+        # 304 Not Modified: the cached page is reused, not refetched
+        not_modified = Response(request.url, status=304)
+        result = mw.process_response(revalidate, not_modified)
+        assert result.status == 200
+        assert result.body == b'jobs'
+
+    @pytest.mark.parametrize('status', [403, 429, 500, 503])
+    def test_errors_are_not_cached(self, mw, status):
+        request = Request('https://careers.example.com/jobs')
+        response = Response(request.url, status=status, headers={'Cache-Control': 'max-age=3600'})
+        mw.process_request(request)
+        mw.process_response(request, response)
+        assert mw.process_request(request.copy()) is None
+
+
+def career_response(body, url='https://careers.example.com/jobs'):
+    company = _Company(url=url, name='Example', region='Europe', country='Germany', type='Studio')
+    request = Request(url, meta={'company': company})
+    return HtmlResponse(url, body=body.encode(), encoding='utf-8', request=request)
+
+
+@pytest.fixture
+def spider():
+    return RemoteJobsSpider.from_crawler(get_crawler(RemoteJobsSpider))
+
+
+class TestCareerPageDedup:
+    def test_link_first_seen_without_keyword_stays_open(self, spider):
+        body = '''
+            <a href="/jobs/1">Apply now</a>
+            <a href="/jobs/1">Senior UI Designer</a>
+        '''
+        jobs = list(spider.parse_career_page(career_response(body)))
+        assert [job['title'] for job in jobs] == ['Senior UI Designer']
+
+    def test_link_is_yielded_once_across_pages(self, spider):
+        body = '<a href="/jobs/2">3D Artist (Remote)</a>'
+        first = list(spider.parse_career_page(career_response(body)))
+        again = list(spider.parse_career_page(career_response(body, 'https://careers.example.com/all')))
+        assert len(first) == 1
+        assert first[0]['link'] == 'https://careers.example.com/jobs/2'
+        assert first[0]['type'] == 'Remote'
+        assert again == []
+
+
+class TestCareerPageLinks:
+    def test_selector_strategies(self, spider):
+        body = '''
+            <a href="/careers/ui-designer">UI Designer</a>
+            <div class="job-card"><a href="/p/42">Motion Designer</a></div>
+            <ul class="openings"><li><a href="https://jobs.example.org/7">Art Director</a></li></ul>
+            <a href="/contact">Contact Designer team</a>
+        '''
+        links = [job['link'] for job in spider.parse_career_page(career_response(body))]
+        assert links == [
+            'https://careers.example.com/careers/ui-designer',
+            'https://careers.example.com/p/42',
+            'https://jobs.example.org/7',
+        ]
+
+    @pytest.mark.parametrize(('anchor', 'title'), [
+        # First descendant text node, as link.css('::text').get() gave
+        ('<a href="/jobs/1"><span>Senior UI Designer</span> - Berlin</a>', 'Senior UI Designer'),
+        ('<a href="/jobs/1"><!-- x -->Senior UI Designer</a>', 'Senior UI Designer'),
+    ])
+    def test_title(self, spider, anchor, title):
+        jobs = list(spider.parse_career_page(career_response(anchor)))
+        assert [job['title'] for job in jobs] == [title]
+
+    @pytest.mark.parametrize('anchor', [
+        '<a href="/jobs/1">UI</a>',  # too short
+        # Whitespace-only first text node strips to nothing (as before)
+        '<a href="/jobs/1">\n  <b>Senior UI Designer</b></a>',
+        '<a href="/careers/blog/ui-designer-tips">UI Designer tips</a>',
+        '<a href="mailto:jobs@example.com?subject=career">UI Designer</a>',
+        '<a href="/jobs/1">Backend Engineer</a>',  # no CV keyword
+    ])
+    def test_skipped(self, spider, anchor):
+        assert list(spider.parse_career_page(career_response(anchor))) == []
+
+
+def jsonld(data):
+    return f'<script type="application/ld+json">{json.dumps(data)}</script>'
+
+
+class TestJsonLd:
+    def test_nested_postings(self, spider):
+        data = {
+            '@context': 'https://schema.org',
+            '@graph': [
+                {'@type': 'Organization', 'name': 'Example'},
+                {'@type': 'ItemList', 'itemListElement': [
+                    {'@type': 'JobPosting', 'title': 'Lead 3D Artist', 'url': 'https://example.com/a',
+                     'jobLocation': {'address': {'addressLocality': 'Lisbon'}}},
+                    {'@type': 'JobPosting', 'title': 'Accountant', 'url': 'https://example.com/b'},
+                ]},
+            ],
+        }
+        jobs = list(spider._extract_jobs_from_jsonld(data, 'Example', 'Europe'))
+        assert [(job['title'], job['location']) for job in jobs] == [
+            ('Lead 3D Artist', 'Lisbon'),
+            ('Accountant', 'Europe'),
+        ]
+        assert jobs[0]['source'] == 'Career Page (Structured) - Example'
+
+    def test_top_level_list(self, spider):
+        data = [{'@type': 'JobPosting', 'title': 'UX Writer', 'jobLocation': [{'address': {}}]}]
+        [job] = spider._extract_jobs_from_jsonld(data, 'Example', 'Europe')
+        assert job['location'] == 'Europe'
+        assert job['link'] == ''
+
+    def test_deep_nesting_does_not_recurse(self, spider):
+        data = {'@type': 'JobPosting', 'title': 'Motion Designer'}
+        for _ in range(5000):
+            data = {'child': data}
+        assert len(list(spider._extract_jobs_from_jsonld(data, 'Example', 'Europe'))) == 1
+
+    def test_career_page_blocks(self, spider):
+        body = (
+            jsonld({'@type': 'Organization', 'name': 'Example'})
+            + '<script type="application/ld+json">{not json, JobPosting</script>'
+            + jsonld({'@type': 'JobPosting', 'title': 'Accountant'})
+            + jsonld({'@type': 'JobPosting', 'title': 'Senior UI Designer', 'url': 'https://example.com/ui'})
+        )
+        jobs = list(spider.parse_career_page(career_response(body)))
+        # Invalid and off-CV blocks are dropped
+        assert [job['title'] for job in jobs] == ['Senior UI Designer']
+
+
+class TestRobotsTxt:
+    def test_only_search_requests_skip_robots_txt(self, spider, monkeypatch):
+        monkeypatch.delenv('SERPAPI_API_KEY', raising=False)
+        requests = list(spider.start_requests())
+        search = [r for r in requests if r.meta.get('source') == 'DuckDuckGo']
+        others = [r for r in requests if r.meta.get('source') != 'DuckDuckGo']
+        assert spider.crawler.settings.getbool('ROBOTSTXT_OBEY')
+        assert search
+        assert all(r.meta['dont_obey_robotstxt'] for r in search)
+        assert all(r.url.startswith('https://html.duckduckgo.com/html/') for r in search)
+        assert others
+        assert not any(r.meta.get('dont_obey_robotstxt') for r in others)
+
+
+class TestRelevantKeywords:
+    def test_default(self, spider):
+        assert spider.has_keyword('Senior UI Designer')
+        assert not spider.has_keyword('Head Chef')
+
+    def test_override(self):
+        spider = RemoteJobsSpider.from_crawler(get_crawler(RemoteJobsSpider), relevant_keywords='Chef,Baker')
+        assert spider.has_keyword('Head Chef')
+        assert not spider.has_keyword('Senior UI Designer')
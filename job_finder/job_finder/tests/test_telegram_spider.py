@@ -0,0 +1,80 @@
+import pytest
+
+from scrapy import Request
+from scrapy.http import HtmlResponse
+from scrapy.utils.test import get_crawler
+
+from job_finder.spiders.telegram_spider import TelegramJobsSpider
+
+
+def message(post_id, text, links=(), views='1.2K'):
+    anchors = ''.join(f' <a href="{link}">{link}</a>' for link in links)
+    return f'''
+        <div class="tgme_widget_message_wrap">
+          <div class="tgme_widget_message" data-post="designjobs/{post_id}">
+            <div class="tgme_widget_message_text">{text}{anchors}</div>
+            <span class="tgme_widget_message_views">{views}</span>
+            <a class="tgme_widget_message_date" href="https://t.me/designjobs/{post_id}">
+              <time datetime="2026-02-17T10:00:00+00:00">10:00</time>
+            </a>
+          </div>
+        </div>
+    '''
+
+
+def channel_response(body):
+    url = 'https://t.me/s/designjobs'
+    meta = {'channel_handle': 'designjobs', 'channel_name': 'Design Jobs', 'region': 'UAE'}
+    return HtmlResponse(url, body=body.encode(), encoding='utf-8', request=Request(url, meta=meta))
+
+
+@pytest.fixture
+def spider():
+    return TelegramJobsSpider.from_crawler(get_crawler(TelegramJobsSpider))
+
+
+class TestParseChannel:
+    def test_job_posts(self, spider):
+        body = (
+            message(1, 'We are hiring a <b>Senior UI Designer</b> (remote, full-time)',
+                    ['https://t.me/other', 'https://acme.example/careers/apply/17'])
+            + message(2, 'Our new 3D showreel is out, check it out on the website')  # no hiring word
+            + message(3, 'UI job')  # too short
+            + message(4, 'Accounting position open in Dubai, apply today')  # no CV keyword
+        )
+        results = list(spider.parse_channel(channel_response(body)))
+        assert len(results) == 1
+        item = results[0]
+        assert item['link'] == 'https://acme.example/careers/apply/17'
+        assert item['telegram_link'] == 'https://t.me/designjobs/1'
+        assert item['channel'] == '@designjobs'
+        assert item['date'] == '2026-02-17T10:00:00+00:00'
+        assert item['views'] == '1.2K'
+        assert 'Senior UI Designer' in item['description']
+
+    def test_posts_are_yielded_once(self, spider):
+        post = message(1, 'Hiring: Motion Designer for a product studio')
+        assert len(list(spider.parse_channel(channel_response(post + post)))) == 1
+        # Also across pages of the same channel
+        assert list(spider.parse_channel(channel_response(post))) == []
+
+    def test_rejected_post_is_not_recorded(self, spider):
+        # Only accepted posts enter the seen filter
+        list(spider.parse_channel(channel_response(message(1, 'short'))))
+        assert 'https://t.me/designjobs/1' not in spider.seen_messages
+
+    def test_load_more(self, spider):
+        body = message(1, 'Hiring a 3D Artist for a VR project') + (
+            '<a class="tme_messages_more" href="/s/designjobs?before=1">more</a>'
+        )
+        results = list(spider.parse_channel(channel_response(body)))
+        [request] = [r for r in results if isinstance(r, Request)]
+        assert request.url == 'https://t.me/s/designjobs?before=1'
+        assert request.meta['channel_handle'] == 'designjobs'
+
+    def test_relevant_keywords_override(self):
+        crawler = get_crawler(TelegramJobsSpider)
+        spider = TelegramJobsSpider.from_crawler(crawler, relevant_keywords='Chef,Baker')
+        body = message(1, 'Hiring: Head Chef for a new restaurant') + message(2, 'Hiring: Senior UI Designer now')
+        results = list(spider.parse_channel(channel_response(body)))
+        assert [item['telegram_link'] for item in results] == ['https://t.me/designjobs/1']
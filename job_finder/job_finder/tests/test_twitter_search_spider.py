@@ -0,0 +1,133 @@
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from scrapy import Request
+from scrapy.http import TextResponse
+from scrapy.utils.test import get_crawler
+
+from job_finder.bloom import RotatingBloomFilter
+from job_finder.spiders.twitter_search_spider import TwitterSearchSpider, _pack_queries, _packed_query
+
+
+def make_spider(**kwargs):
+    return TwitterSearchSpider.from_crawler(get_crawler(TwitterSearchSpider), **kwargs)
+
+
+class TestSeenTweetState:
+    def test_filter_is_stored_in_state(self):
+        spider = make_spider()
+        spider.state = {}
+        list(spider.start_requests())
+        assert spider.state['seen_tweets'] is spider.seen_tweets
+
+    def test_saved_filter_is_reused(self):
+        saved = RotatingBloomFilter(capacity=10)
+        saved.add('1234')
+        spider = make_spider()
+        spider.state = {'seen_tweets': saved}
+        list(spider.start_requests())
+        assert spider.seen_tweets is saved
+        assert '1234' in spider.seen_tweets
+
+    def test_without_jobdir(self):
+        spider = make_spider()
+        list(spider.start_requests())
+        assert isinstance(spider.seen_tweets, RotatingBloomFilter)
+
+
+def api_response(request, tweets, next_token=None):
+    body = {'data': tweets, 'includes': {'users': [{'id': '9', 'username': 'studio', 'name': 'Studio'}]}}
+    if next_token:
+        body['meta'] = {'next_token': next_token}
+    return TextResponse(request.url, body=json.dumps(body).encode(), request=request)
+
+
+def tweets(start, count, text='We are hiring a Senior UI Designer, remote https://example.com/apply'):
+    return [{'id': str(i), 'author_id': '9', 'text': text} for i in range(start, start + count)]
+
+
+def query_params(request):
+    return parse_qs(urlparse(request.url).query)
+
+
+class TestPackQueries:
+    QUERIES = [f'"{word} designer" hiring' for word in (
+        'UI', 'UX', 'product', 'motion', 'graphic', 'brand', '3D', 'game', 'level', 'web',
+        'visual', 'interaction', 'service', 'industrial', 'fashion', 'interior', 'lighting',
+    )]
+    SUFFIX = '-is:retweet lang:en'
+
+    def test_groups_fit_and_keep_order(self):
+        groups = _pack_queries(self.QUERIES, self.SUFFIX, max_len=200)
+        assert len(groups) > 1
+        assert [query for group in groups for query in group] == self.QUERIES
+        for group in groups:
+            assert len(_packed_query(group, self.SUFFIX)) <= 200
+
+    def test_groups_are_full(self):
+        groups = _pack_queries(self.QUERIES, self.SUFFIX, max_len=200)
+        for group, following in zip(groups, groups[1:]):
+            assert len(_packed_query(group + following[:1], self.SUFFIX)) > 200
+
+    def test_oversized_query_stands_alone(self):
+        long_query = 'x' * 600
+        assert _pack_queries(['a', long_query, 'b'], self.SUFFIX) == [['a'], [long_query], ['b']]
+
+    def test_packed_query(self):
+        assert _packed_query(['a b'], self.SUFFIX) == 'a b -is:retweet lang:en'
+        assert _packed_query(['a b', 'c'], self.SUFFIX) == '((a b) OR (c)) -is:retweet lang:en'
+
+
+class TestApiPaging:
+    @pytest.fixture
+    def spider(self):
+        spider = make_spider()
+        spider._api_headers = {}
+        return spider
+
+    def test_groups_per_language(self, spider):
+        spider.search_queries = ['UI designer hiring', 'ui designer HIRING', 'مطلوب مصمم', 'UX designer job']
+        requests = list(spider._api_requests())
+        assert [r.meta['search_query'] for r in requests] == [
+            '((UI designer hiring) OR (UX designer job)) -is:retweet lang:en',
+            'مطلوب مصمم -is:retweet lang:ar',
+        ]
+        assert [r.meta['budget'] for r in requests] == [100, 50]
+        assert query_params(requests[0])['max_results'] == ['100']
+        assert query_params(requests[1])['max_results'] == ['50']
+
+    def test_follows_next_token_up_to_budget(self, spider):
+        spider.search_queries = [f'query {i}' for i in range(5)]
+        [request] = spider._api_requests()
+        assert request.meta['budget'] == 250
+
+        pages, items, start = [], [], 0
+        while request is not None:
+            pages.append(int(query_params(request)['max_results'][0]))
+            count = pages[-1]
+            results = list(spider.parse_api_results(api_response(request, tweets(start, count), 'token')))
+            start += count
+            items += [r for r in results if isinstance(r, dict)]
+            follow = [r for r in results if isinstance(r, Request)]
+            request = follow[0] if follow else None
+            if request is not None:
+                assert query_params(request)['next_token'] == ['token']
+
+        assert pages == [100, 100, 50]
+        assert len(items) == 250
+        assert items[0]['keyword_searched'] == ' | '.join(f'query {i}' for i in range(5))
+
+    def test_last_page_minimum_size(self, spider):
+        spider.search_queries = ['query']
+        [request] = spider._api_requests()
+        request.meta['fetched'] = 45
+        follow = spider._api_search_request(request.meta, 'token')
+        assert query_params(follow)['max_results'] == ['10']
+
+    def test_stops_without_next_token(self, spider):
+        spider.search_queries = [f'query {i}' for i in range(5)]
+        [request] = spider._api_requests()
+        results = list(spider.parse_api_results(api_response(request, tweets(0, 20))))
+        assert not any(isinstance(r, Request) for r in results)
@@ -0,0 +1,126 @@
+import openpyxl
+import pandas as pd
+import pytest
+
+from job_finder import workbook
+from job_finder.workbook import claim_link, jobs_frame, write_workbook
+
+
+@pytest.fixture(params=['jetxl', 'openpyxl'])
+def writer(request, monkeypatch):
+    calls = None
+    if request.param == 'jetxl':
+        if workbook.jetxl is None or workbook.pa is None:
+            pytest.skip('jetxl and pyarrow are not installed')
+        calls = []
+        write_sheets_arrow = workbook.jetxl.write_sheets_arrow
+
+        def spy(*args, **kwargs):
+            calls.append(args)
+            return write_sheets_arrow(*args, **kwargs)
+
+        monkeypatch.setattr(workbook.jetxl, 'write_sheets_arrow', spy)
+    else:
+        monkeypatch.setattr(workbook, 'jetxl', None)
+    # jetxl calls made, or None when only openpyxl is available
+    return calls
+
+
+def read_cells(path):
+    book = openpyxl.load_workbook(path)
+    return {
+        sheet.title: [[cell.value for cell in row] for row in sheet.iter_rows()]
+        for sheet in book.worksheets
+    }
+
+
+class TestWriteWorkbook:
+    def test_cell_types(self, writer, tmp_path):
+        df = pd.DataFrame({
+            'title': ['UI Designer', 'Motion Designer'],
+            'score': [0, 7],
+            'rate': [0.5, float('nan')],
+            'company': ['Acme', None],
+        })
+        path = tmp_path / 'jobs.xlsx'
+        write_workbook({'All Jobs': df}, str(path))
+        rows = read_cells(path)['All Jobs']
+        assert rows[0] == ['title', 'score', 'rate', 'company']
+        assert rows[1] == ['UI Designer', 0, 0.5, 'Acme']
+        assert rows[2] == ['Motion Designer', 7, None, None]
+        # 0 stays an int, not 0.0
+        assert type(rows[1][1]) is int
+        assert writer is None or len(writer) == 1
+
+    def test_several_sheets(self, writer, tmp_path):
+        path = tmp_path / 'jobs.xlsx'
+        write_workbook({
+            'Design': pd.DataFrame({'title': ['UI Designer']}),
+            'Motion': pd.DataFrame({'title': ['Animator'], 'views': [12]}),
+        }, str(path))
+        assert read_cells(path) == {
+            'Design': [['title'], ['UI Designer']],
+            'Motion': [['title', 'views'], ['Animator', 12]],
+        }
+
+    def test_empty_sheet(self, writer, tmp_path):
+        path = tmp_path / 'jobs.xlsx'
+        write_workbook({
+            'Jobs': pd.DataFrame({'title': ['UI Designer']}),
+            'None': pd.DataFrame(columns=['title', 'link']),
+        }, str(path))
+        assert read_cells(path)['None'] == [['title', 'link']]
+        # jetxl cannot write a header-only sheet: the whole workbook falls back
+        assert not writer
+
+    def test_mixed_type_column(self, writer, tmp_path):
+        # Arrow cannot type this column: every cell keeps its own type
+        path = tmp_path / 'jobs.xlsx'
+        write_workbook({'Jobs': pd.DataFrame({'salary': ['1000 EUR', 1500]})}, str(path))
+        assert read_cells(path)['Jobs'] == [['salary'], ['1000 EUR'], [1500]]
+
+
+class TestClaimLink:
+    def test_first_claim_wins(self):
+        seen = set()
+        assert claim_link(seen, 'https://example.com/1')
+        assert not claim_link(seen, 'https://example.com/1')
+        assert claim_link(seen, 'https://example.com/2')
+
+    def test_missing_links_count_as_one(self):
+        seen = set()
+        assert claim_link(seen, None)
+        assert not claim_link(seen, float('nan'))
+        assert not claim_link(seen, None)
+
+
+class TestJobsFrame:
+    def test_records(self):
+        df = jobs_frame([
+            {'title': 'UI Designer', 'link': 'https://example.com/1'},
+            {'title': 'UI Designer (repost)', 'link': 'https://example.com/1'},
+            {'title': 'Animator', 'link': 'https://example.com/2'},
+            {'title': 'No link'},
+            {'title': 'No link either', 'link': None},
+        ])
+        # Same rows drop_duplicates(subset='link') keeps
+        assert df['title'].tolist() == ['UI Designer', 'Animator', 'No link']
+
+    def test_columnar_payload(self):
+        df = jobs_frame({
+            'title': ['UI Designer', 'Repost', 'Animator'],
+            'link': ['https://example.com/1', 'https://example.com/1', 'https://example.com/2'],
+        })
+        assert df['title'].tolist() == ['UI Designer', 'Animator']
+
+    def test_matches_drop_duplicates(self):
+        records = [
+            {'title': 't1', 'link': 'a'}, {'title': 't2', 'link': 'b'}, {'title': 't3', 'link': 'a'},
+            {'title': 't4'}, {'title': 't5', 'link': 'b'}, {'title': 't6'},
+        ]
+        expected = pd.DataFrame(records).drop_duplicates(subset=['link']).reset_index(drop=True)
+        pd.testing.assert_frame_equal(jobs_frame(records), expected)
+
+    def test_without_links(self):
+        records = [{'title': 'UI Designer'}, {'title': 'UI Designer'}]
+        assert len(jobs_frame(records)) == 2
@@ -0,0 +1,51 @@
+import pytest
+
+from scrapy import Request
+from scrapy.http import HtmlResponse
+from scrapy.utils.test import get_crawler
+
+from job_finder.spiders.wuzzuf_spider import WuzzufSpider
+
+CARD = '''
+    <div class="css-ghe2tq">
+      <h2 class="css-193uk2c"><a href="https://wuzzuf.net/jobs/p/1">3D Artist</a></h2>
+      <a class="css-ipsyv7">Studio -</a>
+    </div>
+'''
+
+
+@pytest.fixture
+def spider():
+    spider = WuzzufSpider.from_crawler(get_crawler(WuzzufSpider))
+    spider.keywords = ['3d artist']
+    return spider
+
+
+def parse(spider, request, body):
+    response = HtmlResponse(request.url, body=body.encode(), encoding='utf-8', request=request)
+    results = list(spider.parse(response))
+    return [r for r in results if isinstance(r, dict)], [r for r in results if isinstance(r, Request)]
+
+
+class TestPagination:
+    def test_one_request_per_keyword(self, spider):
+        [request] = spider.start_requests()
+        assert request.url == 'https://wuzzuf.net/search/jobs/?key=3d+artist&a=hpb'
+        assert request.meta['page'] == 0
+
+    def test_follows_pages_with_cards(self, spider):
+        [request] = spider.start_requests()
+        urls = []
+        while request is not None:
+            urls.append(request.url)
+            items, follow = parse(spider, request, CARD)
+            assert len(items) == 1
+            request = follow[0] if follow else None
+        assert urls == [urls[0]] + [f'{urls[0]}&start={page}' for page in range(1, 5)]
+        assert items[0]['keyword_searched'] == '3d artist'
+
+    def test_stops_at_empty_page(self, spider):
+        [request] = spider.start_requests()
+        items, follow = parse(spider, request, '<p>No jobs found</p>')
+        assert items == []
+        assert follow == []
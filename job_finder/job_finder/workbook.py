@@ -0,0 +1,87 @@
+"""
+Workbook Helpers - Shared by the JSON -> Excel converter scripts
+(json_to_excel.py and json_to_excel_v2.py at the repository root).
+
+Optional packages, each with a plain fallback:
+- orjson: faster JSON decoding (falls back to json)
+- pyarrow: Arrow-backed string columns for vectorized cleaning (falls back to str)
+- jetxl + pyarrow: Rust .xlsx writer fed typed Arrow tables (falls back to openpyxl)
+"""
+
+import os
+
+import pandas as pd
+
+try:
+    # Optional fast JSON decoder; orjson.JSONDecodeError subclasses json's
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # Optional Arrow-backed strings: .str.strip()/.str[:n] run as vectorized
+    # pyarrow kernels instead of per-value Python calls
+    import pyarrow as pa
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    pa = None
+    STRING_DTYPE = str
+
+try:
+    # Optional Rust-backed Excel writer (pip install jetxl)
+    import jetxl
+except ImportError:
+    jetxl = None
+
+
+def claim_link(seen, link):
+    """True the first time a link is seen (every missing link counts as one, as with drop_duplicates)"""
+    if link is None or link != link:
+        link = None
+    if link in seen:
+        return False
+    seen.add(link)
+    return True
+
+
+def jobs_frame(data):
+    """DataFrame of a decoded JSON payload, keeping the first job per link"""
+    if not isinstance(data, list) or not all(isinstance(job, dict) for job in data):
+        # Columnar or other shapes: let pandas lay out the rows first
+        data = pd.DataFrame(data).to_dict('records')
+    # Dedup the raw records (one set pass) so the frame is built only from
+    # unique jobs; payloads without any link are left as they are
+    if any('link' in job for job in data):
+        seen = set()
+        data = [job for job in data if claim_link(seen, job.get('link'))]
+    return pd.DataFrame(data)
+
+
+def _arrow_sheets(sheets):
+    """jetxl sheet specs keeping each column's dtype, or None if jetxl can't write them all"""
+    specs = []
+    for name, df in sheets.items():
+        # jetxl cannot write a header-only sheet
+        if df.empty:
+            return None
+        try:
+            table = pa.Table.from_pandas(df.rename(columns=str), preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed-type object column: only openpyxl keeps per-cell types
+            return None
+        specs.append({'name': name, 'data': table})
+    return specs
+
+
+def write_workbook(sheets, path):
+    """Write {sheet name: DataFrame} to one .xlsx file (jetxl if installed, else openpyxl)"""
+    # Typed Arrow tables keep ints as ints, NaN/None/'' as empty cells, so
+    # both writers produce the same cells
+    specs = _arrow_sheets(sheets) if jetxl is not None and pa is not None else None
+    if specs is not None:
+        jetxl.write_sheets_arrow(specs, path, os.cpu_count() or 1)
+        return
+
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
@@ -0,0 +1,22 @@
+"""
+XPath Helpers - CSS selectors compiled once per process
+Per-item selector calls in tight loops skip cssselect translation entirely.
+
+Compiled queries run on a raw lxml node (``selector.root``) and return plain
+strings for ``::text`` / ``::attr()`` queries.
+"""
+
+from typing import List, Optional
+
+from lxml import etree
+from parsel.csstranslator import HTMLTranslator
+
+
+def compile_css(css: str) -> etree.XPath:
+    """Translate a CSS query once and compile it to a reusable lxml XPath"""
+    return etree.XPath(HTMLTranslator().css_to_xpath(css), smart_strings=False)
+
+
+def first(results: List[str]) -> Optional[str]:
+    """First result of a compiled query, or None"""
+    return results[0] if results else None
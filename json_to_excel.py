@@ -7,23 +7,33 @@ import pandas as pd
 import json
 import os
 import re
+import sys
 from datetime import datetime
 
+# Shared converter helpers live in the job_finder package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'job_finder'))
+
+from job_finder.workbook import STRING_DTYPE, claim_link, jobs_frame, json_loads, write_workbook
+
+# Seams between appended Scrapy feeds: "][", "]\n[" or "] ["
+_ARRAY_SEAM_RE = re.compile(rb'\][\n ]?\[')
+
+# Flat {...} objects, for salvaging records from output json_loads rejects
+_JSON_OBJECT_RE = re.compile(rb'\{[^{}]*\}')
+
 
 def fix_json_content(content):
-    """Fix common JSON issues from Scrapy output"""
-    # Fix concatenated arrays: ][  -> ,
-    content = content.replace('][', ',')
-    content = content.replace(']\n[', ',')
-    content = content.replace('] [', ',')
+    """Fix common JSON issues from Scrapy output (content is the file's bytes)"""
+    # Fix concatenated arrays: ][  -> , (one scan; no copy when there is none)
+    content = _ARRAY_SEAM_RE.sub(b',', content)
     
     try:
-        return json.loads(content)
+        return json_loads(content)
     except json.JSONDecodeError:
         # Fallback: extract individual objects
         print("Standard JSON parse failed, using regex extraction...")
-        objects = re.findall(r'\{[^{}]*\}', content)
-        return [json.loads(o) for o in objects]
+        objects = _JSON_OBJECT_RE.findall(content)
+        return [json_loads(o) for o in objects]
 
 
 def json_to_df(filepath):
@@ -33,14 +43,14 @@ def json_to_df(filepath):
         return pd.DataFrame()
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        # Raw UTF-8 bytes: orjson parses them without a str round trip
+        with open(filepath, 'rb') as f:
             content = f.read()
         
-        if not content.strip() or content.strip() in ['[]', '{}']:
+        if not content.strip() or content.strip() in [b'[]', b'{}']:
             return pd.DataFrame()
             
-        data = fix_json_content(content)
-        return pd.DataFrame(data)
+        return jobs_frame(fix_json_content(content))
     except Exception as e:
         print(f"Error reading {filepath}: {e}")
         return pd.DataFrame()
@@ -57,16 +67,13 @@ def clean_dataframe(df):
         if col not in df.columns:
             df[col] = ''
     
-    # Remove duplicates based on link
-    df = df.drop_duplicates(subset=['link'], keep='first')
-    
     # Clean string columns
     for col in ['title', 'company', 'location', 'type', 'source']:
         if col in df.columns:
-            df[col] = df[col].fillna('').astype(str).str.strip()
+            df[col] = df[col].fillna('').astype(STRING_DTYPE).str.strip()
     
-    # Add timestamp
-    df['scraped_at'] = datetime.now().strftime('%Y-%m-%d %H:%M')
+    # Add timestamp (one category shared by every row, not N string copies)
+    df['scraped_at'] = pd.Series(datetime.now().strftime('%Y-%m-%d %H:%M'), index=df.index, dtype='category')
     
     return df
 
@@ -101,37 +108,44 @@ def main():
     print("Job Finder - Excel Export")
     print("="*50 + "\n")
     
-    with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-        for sheet_name, filepath in files.items():
-            df = json_to_df(filepath)
-            
-            if df.empty:
-                print(f"⚪ {sheet_name}: No data")
-                # Create empty sheet with headers
-                df = pd.DataFrame(columns=['title', 'company', 'location', 'type', 'link', 'source', 'scraped_at'])
-            else:
-                df = clean_dataframe(df)
-                stats[sheet_name] = len(df)
-                all_dfs.append(df)
-                print(f"✅ {sheet_name}: {len(df)} jobs found")
-            
-            # Clean sheet name for Excel (max 31 chars, no special chars)
-            safe_name = sheet_name[:31].replace('/', '-')
-            df.to_excel(writer, sheet_name=safe_name, index=False)
+    sheets = {}
+    for sheet_name, filepath in files.items():
+        df = json_to_df(filepath)
+        
+        if df.empty:
+            print(f"⚪ {sheet_name}: No data")
+            # Create empty sheet with headers
+            df = pd.DataFrame(columns=['title', 'company', 'location', 'type', 'link', 'source', 'scraped_at'])
+        else:
+            df = clean_dataframe(df)
+            stats[sheet_name] = len(df)
+            all_dfs.append(df)
+            print(f"✅ {sheet_name}: {len(df)} jobs found")
+        
+        # Clean sheet name for Excel (max 31 chars, no special chars)
+        safe_name = sheet_name[:31].replace('/', '-')
+        sheets[safe_name] = df
+    
+    write_workbook(sheets, excel_path)
     
     print(f"\n📊 Excel file saved: {excel_path}")
     
     # Create combined file
     if all_dfs:
-        combined = pd.concat(all_dfs, ignore_index=True)
-        combined = combined.drop_duplicates(subset=['link'], keep='first')
+        # Each sheet is already unique by link: keep only the rows whose
+        # link no earlier sheet claimed, then concat once
+        seen = set()
+        combined = pd.concat(
+            [df[[claim_link(seen, link) for link in df['link']]] for df in all_dfs],
+            ignore_index=True
+        )
         
         # Sort by source then by title
         if 'source' in combined.columns and 'title' in combined.columns:
             combined = combined.sort_values(['source', 'title'])
         
         combined_path = 'job_finder/all_jobs_combined.xlsx'
-        combined.to_excel(combined_path, index=False)
+        write_workbook({'Sheet1': combined}, combined_path)
         
         print(f"📊 Combined Excel: {combined_path}")
         print(f"\n" + "="*50)
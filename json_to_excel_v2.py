@@ -3,8 +3,8 @@ JSON to Excel Converter v2.0
 Creates Excel file with multiple sheets organized by source, category, and region
 """
 
-import json
 import os
+import sys
 import glob
 from datetime import datetime
 
@@ -14,6 +14,11 @@ except ImportError:
     print("pandas not installed. Run: pip install pandas openpyxl")
     exit(1)
 
+# Shared converter helpers live in the job_finder package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'job_finder'))
+
+from job_finder.workbook import STRING_DTYPE, jobs_frame, json_loads, write_workbook
+
 # Directories
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 OUTPUT_DIR = os.path.join(BASE_DIR, 'job_finder', 'output')
@@ -22,6 +27,9 @@ BY_CATEGORY = os.path.join(OUTPUT_DIR, 'by_category')
 BY_REGION = os.path.join(OUTPUT_DIR, 'by_region')
 SOCIAL_MEDIA = os.path.join(OUTPUT_DIR, 'social_media')
 
+# Characters Excel does not allow in sheet names: one translate pass per name
+_SHEET_NAME_TRANS = str.maketrans({'/': '-', '\\': '-', ':': '', '*': '', '?': '', '[': '', ']': ''})
+
 
 def load_json_file(filepath):
     """Load and parse JSON file"""
@@ -29,11 +37,12 @@ def load_json_file(filepath):
         return []
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        # Raw UTF-8 bytes: orjson parses them without a str round trip
+        with open(filepath, 'rb') as f:
             content = f.read()
-            if '][' in content:
-                content = content.replace('][', ',')
-            return json.loads(content)
+            if b'][' in content:
+                content = content.replace(b'][', b',')
+            return json_loads(content)
     except:
         return []
 
@@ -55,14 +64,10 @@ def clean_dataframe(df):
     other = [c for c in df.columns if c not in priority_columns]
     df = df[existing + other]
     
-    # Remove duplicates
-    if 'link' in df.columns:
-        df = df.drop_duplicates(subset=['link'], keep='first')
-    
-    # Truncate long text
+    # Truncate long text (missing values become empty cells, not 'None')
     for col in df.columns:
         if df[col].dtype == 'object':
-            df[col] = df[col].astype(str).str[:500]
+            df[col] = df[col].fillna('').astype(STRING_DTYPE).str[:500]
     
     return df
 
@@ -132,10 +137,9 @@ def create_excel_v2():
         jobs = load_json_file(filepath)
         if jobs:
             # Clean sheet name for Excel (max 31 chars, no special chars)
-            clean_name = sheet_name[:31].replace('/', '-').replace('\\', '-')
-            clean_name = clean_name.replace(':', '').replace('*', '').replace('?', '')
+            clean_name = sheet_name[:31].translate(_SHEET_NAME_TRANS)
             
-            df = pd.DataFrame(jobs)
+            df = jobs_frame(jobs)
             df = clean_dataframe(df)
             sheets[clean_name] = df
             print(f"  ✓ {sheet_name}: {len(df)} jobs")
@@ -163,16 +167,11 @@ def create_excel_v2():
     # --- WRITE TO EXCEL ---
     print(f"\nWriting to Excel: {excel_path}")
     
+    # Summary first, then all other sheets
+    workbook = {'Summary': summary_df} if not summary_df.empty else {}
+    workbook.update((name, df) for name, df in sheets.items() if not df.empty)
     for out_path in [excel_path, latest_path]:
-        with pd.ExcelWriter(out_path, engine='openpyxl') as writer:
-            # Summary first
-            if not summary_df.empty:
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
-
-            # All other sheets
-            for sheet_name, df in sheets.items():
-                if not df.empty:
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+        write_workbook(workbook, out_path)
 
     print("\n" + "=" * 60)
     print("  EXCEL EXPORT COMPLETE!")
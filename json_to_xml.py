@@ -5,10 +5,17 @@ Reads all scraped JSON files and produces one big XML file with all jobs.
 
 import json
 import os
+import re
 import glob
 from datetime import datetime
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom.minidom import parseString
+import shutil
+from lxml import etree
+
+try:
+    # Optional fast JSON decoder; orjson.JSONDecodeError subclasses json's
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Directories
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -16,17 +23,24 @@ OUTPUT_DIR = os.path.join(BASE_DIR, 'job_finder', 'output')
 BY_SOURCE = os.path.join(OUTPUT_DIR, 'by_source')
 SOCIAL_MEDIA = os.path.join(OUTPUT_DIR, 'social_media')
 
+# Characters XML 1.0 cannot hold: C0 controls other than tab/newline/CR, U+FFFE, U+FFFF
+_XML_INVALID_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+# Spaces and hyphens in extra keys become underscores in element names
+_ELEMENT_NAME_TRANS = str.maketrans(' -', '__')
+
 
 def load_json_file(filepath):
     """Load and parse JSON file, handling various formats"""
     if not os.path.exists(filepath):
         return []
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        # Raw UTF-8 bytes: orjson parses them without a str round trip
+        with open(filepath, 'rb') as f:
             content = f.read()
-            if '][' in content:
-                content = content.replace('][', ',')
-            return json.loads(content)
+            if b'][' in content:
+                content = content.replace(b'][', b',')
+            return json_loads(content)
     except (json.JSONDecodeError, Exception):
         return []
 
@@ -50,10 +64,42 @@ def sanitize_xml_text(text):
     if not text:
         return ''
     # Remove XML-invalid control characters (keep tab, newline, carriage return)
-    return ''.join(
-        c for c in str(text)
-        if c == '\t' or c == '\n' or c == '\r' or (ord(c) >= 0x20 and ord(c) != 0xFFFE and ord(c) != 0xFFFF)
-    )
+    return _XML_INVALID_RE.sub('', str(text))
+
+
+def build_job_element(job, fields):
+    """One <job> element: standard fields first, then any extra keys"""
+    job_el = etree.Element('job')
+
+    for field in fields:
+        value = job.get(field)
+        if value is not None and str(value).strip():
+            child = etree.SubElement(job_el, field.replace(' ', '_'))
+            child.text = sanitize_xml_text(value) or None
+
+    # Include any extra fields not in the standard list
+    for key, value in job.items():
+        if key not in fields and value is not None and str(value).strip():
+            safe_key = key.translate(_ELEMENT_NAME_TRANS)
+            # Skip keys that aren't valid XML element names
+            if safe_key and safe_key[0].isalpha():
+                child = etree.SubElement(job_el, safe_key)
+                child.text = sanitize_xml_text(value) or None
+
+    return job_el
+
+
+def write_jobs_xml(path, jobs, fields):
+    """Stream jobs to an indented XML file, one <job> element at a time"""
+    with etree.xmlfile(path, encoding='utf-8') as xf:
+        xf.write_declaration()
+        attrib = {'generated': datetime.now().isoformat(), 'total': str(len(jobs))}
+        with xf.element('jobs', attrib):
+            for job in jobs:
+                job_el = build_job_element(job, fields)
+                etree.indent(job_el, space='  ', level=1)
+                xf.write('\n  ', job_el)
+            xf.write('\n')
 
 
 def main():
@@ -95,12 +141,6 @@ def main():
     all_jobs = deduplicate_jobs(all_jobs)
     print(f"After deduplication: {len(all_jobs)}")
 
-    # Build XML
-    print("\nBuilding XML...")
-    root = Element('jobs')
-    root.set('generated', datetime.now().isoformat())
-    root.set('total', str(len(all_jobs)))
-
     # Standard fields to include
     fields = [
         'title', 'company', 'location', 'type', 'link', 'source',
@@ -108,36 +148,15 @@ def main():
         'relevance_score', 'job_category', 'region_category', 'is_remote',
     ]
 
-    for job in all_jobs:
-        job_el = SubElement(root, 'job')
-
-        for field in fields:
-            value = job.get(field)
-            if value is not None and str(value).strip():
-                child = SubElement(job_el, field.replace(' ', '_'))
-                child.text = sanitize_xml_text(value)
-
-        # Include any extra fields not in the standard list
-        for key, value in job.items():
-            if key not in fields and value is not None and str(value).strip():
-                safe_key = key.replace(' ', '_').replace('-', '_')
-                # Skip keys that aren't valid XML element names
-                if safe_key and safe_key[0].isalpha():
-                    child = SubElement(job_el, safe_key)
-                    child.text = sanitize_xml_text(value)
-
-    # Pretty print
-    raw_xml = tostring(root, encoding='unicode')
-    pretty_xml = parseString(raw_xml).toprettyxml(indent='  ', encoding='utf-8')
-
-    # Save
+    # Build and save XML, writing each job as it is built (the whole
+    # document is never held in memory)
+    print("\nBuilding XML...")
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     xml_path = os.path.join(BASE_DIR, 'job_finder', f'all_jobs_{timestamp}.xml')
     latest_path = os.path.join(BASE_DIR, 'job_finder', 'all_jobs_latest.xml')
 
-    for out_path in [xml_path, latest_path]:
-        with open(out_path, 'wb') as f:
-            f.write(pretty_xml)
+    write_jobs_xml(xml_path, all_jobs, fields)
+    shutil.copyfile(xml_path, latest_path)
 
     print("\n" + "=" * 60)
     print("  XML EXPORT COMPLETE!")